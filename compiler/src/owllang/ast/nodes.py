@@ -11,6 +11,8 @@ Structure:
     - FnDecl, Program: Top-level declarations
 
 All nodes support optional Span for source location tracking.
+Nodes are slotted dataclasses (base classes included), so instances
+carry no per-object __dict__.
 """
 
 from __future__ import annotations
@@ -93,7 +95,7 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """A single token from the source code."""
 
@@ -116,14 +118,14 @@ class Token:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Expr:
     """Base class for all expression nodes."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IntLiteral(Expr):
     """Integer literal: 42"""
 
@@ -131,7 +133,7 @@ class IntLiteral(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatLiteral(Expr):
     """Float literal: 3.14"""
 
@@ -139,7 +141,7 @@ class FloatLiteral(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expr):
     """String literal: "hello" """
 
@@ -147,7 +149,7 @@ class StringLiteral(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BoolLiteral(Expr):
     """Boolean literal: true, false"""
 
@@ -155,7 +157,7 @@ class BoolLiteral(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expr):
     """Variable reference: x, my_var"""
 
@@ -163,7 +165,7 @@ class Identifier(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expr):
     """Binary operation: a + b, x == y"""
 
@@ -173,7 +175,7 @@ class BinaryOp(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expr):
     """Unary operation: -x, !flag"""
 
@@ -182,7 +184,7 @@ class UnaryOp(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Expr):
     """Function call: print(x), math.sqrt(4)"""
 
@@ -191,7 +193,7 @@ class Call(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldAccess(Expr):
     """Field/attribute access: math.pi, obj.method"""
 
@@ -200,7 +202,7 @@ class FieldAccess(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TryExpr(Expr):
     """
     Try operator: expr?
@@ -214,7 +216,7 @@ class TryExpr(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListLiteral(Expr):
     """
     List literal: [1, 2, 3]
@@ -226,40 +228,40 @@ class ListLiteral(Expr):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """Base class for match patterns."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SomePattern(Pattern):
     """Pattern: Some(binding)"""
     binding: str
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class NonePattern(Pattern):
     """Pattern: None"""
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class OkPattern(Pattern):
     """Pattern: Ok(binding)"""
     binding: str
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrPattern(Pattern):
     """Pattern: Err(binding)"""
     binding: str
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchArm:
     """
     A single arm in a match expression.
@@ -271,7 +273,7 @@ class MatchArm:
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchExpr(Expr):
     """
     Match expression for pattern matching.
@@ -291,7 +293,7 @@ class MatchExpr(Expr):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAnnotation:
     """
     Type annotation node for parameterized types.
@@ -318,14 +320,14 @@ class TypeAnnotation:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Stmt:
     """Base class for all statement nodes."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LetStmt(Stmt):
     """Variable declaration: let x = 10 or let mut x = 10"""
 
@@ -336,7 +338,7 @@ class LetStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(Stmt):
     """Assignment to mutable variable: x = 20"""
 
@@ -345,7 +347,7 @@ class AssignStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(Stmt):
     """Expression as statement: print(x)"""
 
@@ -353,7 +355,7 @@ class ExprStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Stmt):
     """Return statement: return x + y"""
 
@@ -361,7 +363,7 @@ class ReturnStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Stmt):
     """While loop: while condition { body }"""
 
@@ -370,21 +372,21 @@ class WhileStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakStmt(Stmt):
     """Break statement: break"""
 
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStmt(Stmt):
     """Continue statement: continue"""
 
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ForInStmt(Stmt):
     """For-in loop: for item in collection { body }"""
 
@@ -394,7 +396,7 @@ class ForInStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopStmt(Stmt):
     """Infinite loop: loop { body }"""
 
@@ -402,7 +404,7 @@ class LoopStmt(Stmt):
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Stmt):
     """If statement: if x > 0 { ... } else { ... }"""
 
@@ -417,7 +419,7 @@ class IfStmt(Stmt):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Function parameter: name: Type"""
 
@@ -426,7 +428,7 @@ class Parameter:
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FnDecl:
     """Function declaration: fn add(a, b) { ... }"""
 
@@ -437,7 +439,7 @@ class FnDecl:
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonImport:
     """Python import: from python import math"""
 
@@ -446,7 +448,7 @@ class PythonImport:
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonFromImport:
     """Python from import: from python.os.path import join, exists"""
 
@@ -455,7 +457,7 @@ class PythonFromImport:
     span: Optional[Span] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Program:
     """Root AST node containing the entire program."""
 
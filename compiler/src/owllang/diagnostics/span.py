@@ -7,7 +7,7 @@ Used for precise error reporting and source highlighting.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,14 +21,17 @@ class Position:
     line: int
     column: int
     offset: int = 0  # Byte offset from start of file
+    _key: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Ordering key: line in the high bits, column in the low 32 bits
+        object.__setattr__(self, '_key', (self.line << 32) | self.column)
     
     def __str__(self) -> str:
         return f"{self.line}:{self.column}"
     
     def __lt__(self, other: Position) -> bool:
-        if self.line != other.line:
-            return self.line < other.line
-        return self.column < other.column
+        return self._key < other._key
 
 
 @dataclass(frozen=True)
@@ -81,10 +84,10 @@ class Span:
     
     def merge(self, other: Span) -> Span:
         """Merge two spans into one that covers both."""
-        start = self.start if self.start < other.start else other.start
-        end = other.end if other.end.line > self.end.line or (
-            other.end.line == self.end.line and other.end.column > self.end.column
-        ) else self.end
+        start = self.start if self.start._key <= other.start._key else other.start
+        end = self.end if self.end._key >= other.end._key else other.end
+        if start is self.start and end is self.end:
+            return self
         return Span(start, end, self.filename)
     
     @property
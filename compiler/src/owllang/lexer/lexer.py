@@ -6,8 +6,73 @@ Converts source code into a stream of tokens.
 
 from __future__ import annotations
 
+import re
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from ..ast import Token, TokenType
 
+# Raw token record: (type, value, line, column)
+RawToken = tuple[TokenType, str, int, int]
+
+# Keyword lookup table. The plain dict is used on hot paths; the public
+# name is a read-only view so the table cannot be mutated at runtime.
+_KEYWORDS: dict[str, TokenType] = {
+    'fn': TokenType.FN,
+    'let': TokenType.LET,
+    'mut': TokenType.MUT,
+    'while': TokenType.WHILE,
+    'break': TokenType.BREAK,
+    'continue': TokenType.CONTINUE,
+    'for': TokenType.FOR,
+    'in': TokenType.IN,
+    'loop': TokenType.LOOP,
+    'from': TokenType.FROM,
+    'python': TokenType.PYTHON,
+    'import': TokenType.IMPORT,
+    'as': TokenType.AS,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'return': TokenType.RETURN,
+    'true': TokenType.TRUE,
+    'false': TokenType.FALSE,
+    'match': TokenType.MATCH,
+}
+KEYWORDS: Mapping[str, TokenType] = MappingProxyType(_KEYWORDS)
+
+# Single-character tokens
+_SINGLE_CHARS: dict[str, TokenType] = {
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.STAR,
+    '/': TokenType.SLASH,
+    '%': TokenType.PERCENT,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA,
+    ':': TokenType.COLON,
+    '.': TokenType.DOT,
+    '?': TokenType.QUESTION,
+}
+SINGLE_CHARS: Mapping[str, TokenType] = MappingProxyType(_SINGLE_CHARS)
+
+# String escape sequences (\n, \t, ...). Unknown escapes resolve to the
+# escaped character itself.
+ESCAPE_MAP: Mapping[str, str] = MappingProxyType({
+    'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"',
+})
+
+# Runs of horizontal whitespace (newlines are handled by _scan_token)
+_WHITESPACE_RE = re.compile(r'[ \t\r]+')
+
+# 256-entry lookup table indexed by ord(escape_char) for the Latin-1 range
+_ESCAPE_LUT: tuple[str, ...] = tuple(ESCAPE_MAP.get(chr(i), chr(i)) for i in range(256))
+
 
 class LexerError(Exception):
     """Error during lexical analysis."""
@@ -29,65 +94,31 @@ class Lexer:
         tokens = lexer.tokenize()
     """
     
-    # Keywords mapping
-    KEYWORDS: dict[str, TokenType] = {
-        'fn': TokenType.FN,
-        'let': TokenType.LET,
-        'mut': TokenType.MUT,
-        'while': TokenType.WHILE,
-        'break': TokenType.BREAK,
-        'continue': TokenType.CONTINUE,
-        'for': TokenType.FOR,
-        'in': TokenType.IN,
-        'loop': TokenType.LOOP,
-        'from': TokenType.FROM,
-        'python': TokenType.PYTHON,
-        'import': TokenType.IMPORT,
-        'as': TokenType.AS,
-        'if': TokenType.IF,
-        'else': TokenType.ELSE,
-        'return': TokenType.RETURN,
-        'true': TokenType.TRUE,
-        'false': TokenType.FALSE,
-        'match': TokenType.MATCH,
-    }
-    
-    # Single-character tokens
-    SINGLE_CHARS: dict[str, TokenType] = {
-        '+': TokenType.PLUS,
-        '-': TokenType.MINUS,
-        '*': TokenType.STAR,
-        '/': TokenType.SLASH,
-        '%': TokenType.PERCENT,
-        '(': TokenType.LPAREN,
-        ')': TokenType.RPAREN,
-        '{': TokenType.LBRACE,
-        '}': TokenType.RBRACE,
-        '[': TokenType.LBRACKET,
-        ']': TokenType.RBRACKET,
-        ',': TokenType.COMMA,
-        ':': TokenType.COLON,
-        '.': TokenType.DOT,
-        '?': TokenType.QUESTION,
-    }
+    # Keywords and single-character tokens (read-only views)
+    KEYWORDS: Mapping[str, TokenType] = KEYWORDS
+    SINGLE_CHARS: Mapping[str, TokenType] = SINGLE_CHARS
     
     def __init__(self, source: str) -> None:
         self.source = source
         self.pos = 0
         self.line = 1
         self.column = 1
-        self.tokens: list[Token] = []
+        self._raw: list[RawToken] = []
         # Cache source length to avoid repeated len() calls
         self.source_len = len(source)
     
     def tokenize(self) -> list[Token]:
-        """Convert source code to list of tokens."""
-        while not self._is_at_end():
-            self._scan_token()
+        """Convert source code to a list of tokens."""
+        # Bind hot-loop lookups to locals
+        scan_token = self._scan_token
+        source_len = self.source_len
+        while self.pos < source_len:
+            scan_token()
         
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        return self.tokens
+        self._raw.append((TokenType.EOF, '', self.line, self.column))
+        # Build every Token in one pass; the parser reads them all anyway
+        return [Token(*raw) for raw in self._raw]
     
     def _is_at_end(self) -> bool:
         """Check if we've consumed all source code."""
@@ -112,18 +143,24 @@ class Lexer:
         return char
     
     def _add_token(self, token_type: TokenType, value: str, line: int, column: int) -> None:
-        """Add a token to the list."""
-        self.tokens.append(Token(token_type, value, line, column))
+        """Record a raw token; Token objects are built at the end of tokenize()."""
+        self._raw.append((token_type, value, line, column))
     
     def _skip_whitespace(self) -> None:
         """Skip spaces, tabs (but not newlines for now)."""
-        while not self._is_at_end() and self._peek() in ' \t\r':
-            self._advance()
+        match = _WHITESPACE_RE.match(self.source, self.pos)
+        if match:
+            end = match.end()
+            self.column += end - self.pos
+            self.pos = end
     
     def _skip_comment(self) -> None:
         """Skip // comments until end of line."""
-        while not self._is_at_end() and self._peek() != '\n':
-            self._advance()
+        end = self.source.find('\n', self.pos)
+        if end < 0:
+            end = self.source_len
+        self.column += end - self.pos
+        self.pos = end
     
     def _skip_multiline_comment(self, start_line: int, start_column: int) -> None:
         """Skip /** ... */ multi-line comments."""
@@ -132,20 +169,23 @@ class Lexer:
         self._advance()  # *
         self._advance()  # *
         
-        while not self._is_at_end():
-            if self._peek() == '*' and self._peek(1) == '/':
-                self._advance()  # *
-                self._advance()  # /
-                return
-            self._advance()
+        end = self.source.find('*/', self.pos)
+        if end < 0:
+            raise LexerError(
+                "Unterminated multi-line comment",
+                start_line,
+                start_column,
+                hint="did you forget to close the comment with '*/'?"
+            )
         
-        # If we reach here, comment was not closed
-        raise LexerError(
-            "Unterminated multi-line comment",
-            start_line,
-            start_column,
-            hint="did you forget to close the comment with '*/'?"
-        )
+        # Account for the skipped text and the closing */ in one step
+        newlines = self.source.count('\n', self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.source.rfind('\n', self.pos, end) + 2
+        else:
+            self.column += end - self.pos + 2
+        self.pos = end + 2
     
     def _scan_token(self) -> None:
         """Scan the next token."""
@@ -226,9 +266,10 @@ class Lexer:
             self._add_token(TokenType.GT, '>', start_line, start_column)
             return
         
-        if char in self.SINGLE_CHARS:
+        single_type = _SINGLE_CHARS.get(char)
+        if single_type is not None:
             self._advance()
-            self._add_token(self.SINGLE_CHARS[char], char, start_line, start_column)
+            self._add_token(single_type, char, start_line, start_column)
             return
         
         # String literals
@@ -265,8 +306,8 @@ class Lexer:
             if self._peek() == '\\':
                 self._advance()
                 escape_char = self._advance()
-                escape_map = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"'}
-                value += escape_map.get(escape_char, escape_char)
+                code = ord(escape_char)
+                value += _ESCAPE_LUT[code] if code < 256 else escape_char
             else:
                 value += self._advance()
         
@@ -329,7 +370,9 @@ class Lexer:
             else:
                 break
         
-        value = source[start_pos:pos]
+        # Interned, so every later use of the name (AST nodes, checker scope
+        # keys, keyword lookup) hashes once and compares by identity
+        value = sys.intern(source[start_pos:pos])
         
         # Update position and column
         chars_consumed = pos - self.pos
@@ -337,7 +380,7 @@ class Lexer:
         self.pos = pos
         
         # Check if it's a keyword
-        token_type = self.KEYWORDS.get(value, TokenType.IDENT)
+        token_type = _KEYWORDS.get(value, TokenType.IDENT)
         self._add_token(token_type, value, start_line, start_column)
 
 
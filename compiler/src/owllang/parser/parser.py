@@ -7,6 +7,7 @@ Uses recursive descent parsing.
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from ..ast import (
@@ -25,6 +26,7 @@ from ..ast import (
     Parameter, FnDecl, PythonImport, PythonFromImport, Program
 )
 
+
 if TYPE_CHECKING:
     from ..diagnostics.span import Span
 
@@ -53,6 +55,26 @@ SYNC_TOKENS = frozenset({
     TokenType.RBRACE,
 })
 
+# Binding power (higher binds tighter) and operator text of each binary
+# operator. All binary operators are left-associative. The text is interned
+# so every BinaryOp.operator for a given operator is the same str object.
+_BINARY_OPERATORS: dict[TokenType, tuple[int, str]] = {
+    TokenType.EQ: (1, sys.intern("==")), TokenType.NE: (1, sys.intern("!=")),
+    TokenType.LT: (1, sys.intern("<")), TokenType.GT: (1, sys.intern(">")),
+    TokenType.LE: (1, sys.intern("<=")), TokenType.GE: (1, sys.intern(">=")),
+    TokenType.PLUS: (2, sys.intern("+")), TokenType.MINUS: (2, sys.intern("-")),
+    TokenType.STAR: (3, sys.intern("*")), TokenType.SLASH: (3, sys.intern("/")),
+    TokenType.PERCENT: (3, sys.intern("%")),
+}
+_NO_OPERATOR = (0, "")
+
+# Match patterns that bind a name: Some(x), Ok(v), Err(e)
+_BINDING_PATTERNS: dict[str, type[SomePattern | OkPattern | ErrPattern]] = {
+    "Some": SomePattern,
+    "Ok": OkPattern,
+    "Err": ErrPattern,
+}
+
 
 class Parser:
     """
@@ -70,10 +92,11 @@ class Parser:
         if_stmt     → "if" expr block ("else" block)?
         expr_stmt   → expr
         
-        expr        → comparison
-        comparison  → addition (("==" | "!=" | "<" | ">" | "<=" | ">=") addition)*
-        addition    → multiplication (("+" | "-") multiplication)*
-        multiplication → unary (("*" | "/" | "%") unary)*
+        expr        → binary
+        binary      → unary (binop unary)*      (precedence climbing)
+        binop       → "==" | "!=" | "<" | ">" | "<=" | ">="   (lowest)
+                    | "+" | "-"
+                    | "*" | "/" | "%"                         (highest)
         unary       → ("-") unary | call
         call        → primary ("(" arguments? ")" | "." IDENT)*
         primary     → INT | FLOAT | STRING | BOOL | IDENT | "(" expr ")"
@@ -86,6 +109,9 @@ class Parser:
     
     def __init__(self, tokens: list[Token], filename: str = "<unknown>") -> None:
         self.tokens = tokens
+        # Parallel array of token types: hot loops test types[pos] without
+        # an attribute read on a Token
+        self._types = [t.type for t in tokens]
         self.pos = 0
         self.filename = filename
         self.errors: list[ParseError] = []
@@ -97,11 +123,16 @@ class Parser:
         functions: list[FnDecl] = []
         statements: list[Stmt] = []
         
-        while not self._is_at_end():
+        types = self._types
+        while True:
+            # One type read per top-level item; enum members compare by identity
+            ttype = types[self.pos]
+            if ttype is TokenType.EOF:
+                break
             try:
-                if self._check(TokenType.FROM):
+                if ttype is TokenType.FROM:
                     imports.append(self._parse_import())
-                elif self._check(TokenType.FN):
+                elif ttype is TokenType.FN:
                     functions.append(self._parse_fn_decl())
                 else:
                     statements.append(self._parse_statement())
@@ -454,67 +485,51 @@ class Parser:
         """Get span from an expression if available."""
         return getattr(expr, 'span', None)
     
-    def _merge_spans(self, left: Expr, right: Expr) -> "Span | None":
-        """Create a span covering both expressions, if spans are available."""
-        left_span = self._expr_span(left)
-        right_span = self._expr_span(right)
-        if left_span and right_span:
-            return left_span.merge(right_span)
-        return left_span or right_span
-    
     def _parse_expr(self) -> Expr:
         """Parse expression (entry point)."""
-        return self._parse_comparison()
+        return self._parse_binary()
     
-    def _parse_comparison(self) -> Expr:
-        """Parse: addition (("==" | "!=" | "<" | ">" | "<=" | ">=") addition)*"""
-        expr = self._parse_addition()
-        
-        while True:
-            op_token = self._match(
-                TokenType.EQ, TokenType.NE,
-                TokenType.LT, TokenType.GT,
-                TokenType.LE, TokenType.GE
-            )
-            if not op_token:
-                break
-            right = self._parse_addition()
-            span = self._merge_spans(expr, right)
-            expr = BinaryOp(expr, op_token.value, right, span=span)
-        
-        return expr
-    
-    def _parse_addition(self) -> Expr:
-        """Parse: multiplication (("+" | "-") multiplication)*"""
-        expr = self._parse_multiplication()
+    def _parse_binary(self, min_prec: int = 1) -> Expr:
+        """
+        Parse binary operators by precedence climbing.
         
-        while True:
-            op_token = self._match(TokenType.PLUS, TokenType.MINUS)
-            if not op_token:
-                break
-            right = self._parse_multiplication()
-            span = self._merge_spans(expr, right)
-            expr = BinaryOp(expr, op_token.value, right, span=span)
+        Parses a unary operand, then folds in every operator whose binding
+        power is at least min_prec. The right operand is parsed with
+        min_prec + 1, which makes operators left-associative.
         
-        return expr
-    
-    def _parse_multiplication(self) -> Expr:
-        """Parse: unary (("*" | "/" | "%") unary)*"""
+        The loop reads token types by index instead of going through _match:
+        self.pos is never past EOF and an operator token is never EOF, so
+        advancing with `self.pos += 1` matches _advance().
+        """
+        types = self._types
+        operators = _BINARY_OPERATORS
+        parse_binary = self._parse_binary
         expr = self._parse_unary()
         
         while True:
-            op_token = self._match(TokenType.STAR, TokenType.SLASH, TokenType.PERCENT)
-            if not op_token:
+            prec, operator = operators.get(types[self.pos], _NO_OPERATOR)
+            if prec < min_prec:
                 break
-            right = self._parse_unary()
-            span = self._merge_spans(expr, right)
-            expr = BinaryOp(expr, op_token.value, right, span=span)
+            # The operator token is skipped without building it: the node
+            # takes its text from the table and its span from the operands
+            self.pos += 1
+            right = parse_binary(prec + 1)
+            # Span covering both operands (inlined: runs once per operator)
+            left_span = getattr(expr, 'span', None)
+            right_span = getattr(right, 'span', None)
+            if left_span and right_span:
+                span = left_span.merge(right_span)
+            else:
+                span = left_span or right_span
+            expr = BinaryOp(expr, operator, right, span=span)
         
         return expr
     
     def _parse_unary(self) -> Expr:
         """Parse: ("-") unary | call"""
-        if op_token := self._match(TokenType.MINUS):
+        if self._types[self.pos] is TokenType.MINUS:
+            op_token = self.tokens[self.pos]
+            self.pos += 1
             operand = self._parse_unary()
             operand_span = self._expr_span(operand)
             if operand_span:
@@ -527,10 +542,16 @@ class Parser:
     
     def _parse_call(self) -> Expr:
         """Parse: primary ("(" arguments ")" | "." IDENT | "?")*"""
+        tokens = self.tokens
+        types = self._types
+        TT = TokenType
         expr = self._parse_primary()
         
         while True:
-            if lparen := self._match(TokenType.LPAREN):
+            ttype = types[self.pos]
+            if ttype is TT.LPAREN:
+                token = tokens[self.pos]
+                self.pos += 1
                 # Function call
                 args = self._parse_arguments()
                 rparen = self._expect(TokenType.RPAREN, "Expected ')' after arguments")
@@ -538,9 +559,10 @@ class Parser:
                 if callee_span:
                     span = callee_span.merge(rparen.span(self.filename))
                 else:
-                    span = lparen.span(self.filename).merge(rparen.span(self.filename))
+                    span = token.span(self.filename).merge(rparen.span(self.filename))
                 expr = Call(expr, args, span=span)
-            elif self._match(TokenType.DOT):
+            elif ttype is TT.DOT:
+                self.pos += 1
                 # Field access
                 field_token = self._expect(TokenType.IDENT, "Expected field name after '.'")
                 base_span = self._expr_span(expr)
@@ -549,13 +571,15 @@ class Parser:
                 else:
                     span = field_token.span(self.filename)
                 expr = FieldAccess(expr, field_token.value, span=span)
-            elif question_tok := self._match(TokenType.QUESTION):
+            elif ttype is TT.QUESTION:
+                token = tokens[self.pos]
+                self.pos += 1
                 # Try operator (?)
                 base_span = self._expr_span(expr)
                 if base_span:
-                    span = base_span.merge(question_tok.span(self.filename))
+                    span = base_span.merge(token.span(self.filename))
                 else:
-                    span = question_tok.span(self.filename)
+                    span = token.span(self.filename)
                 expr = TryExpr(expr, span=span)
             else:
                 break
@@ -578,38 +602,55 @@ class Parser:
     
     def _parse_primary(self) -> Expr:
         """Parse primary expression (literals, identifiers, grouped, match, list)."""
-        # Integer
-        if token := self._match(TokenType.INT):
+        # One type read selects the branch; the chosen token is never EOF,
+        # so it can be stepped over in place instead of via _match/_advance
+        ttype = self._types[self.pos]
+        
+        # Identifier
+        if ttype is TokenType.IDENT:
+            token = self.tokens[self.pos]
+            self.pos += 1
+            return Identifier(token.value, span=token.span(self.filename))
+        
+        # Integer (the token keeps its source text; convert exactly once here)
+        if ttype is TokenType.INT:
+            token = self.tokens[self.pos]
+            self.pos += 1
             return IntLiteral(int(token.value), span=token.span(self.filename))
         
         # Float
-        if token := self._match(TokenType.FLOAT):
+        if ttype is TokenType.FLOAT:
+            token = self.tokens[self.pos]
+            self.pos += 1
             return FloatLiteral(float(token.value), span=token.span(self.filename))
         
         # String
-        if token := self._match(TokenType.STRING):
+        if ttype is TokenType.STRING:
+            token = self.tokens[self.pos]
+            self.pos += 1
             return StringLiteral(token.value, span=token.span(self.filename))
         
         # Boolean
-        if token := self._match(TokenType.TRUE):
-            return BoolLiteral(True, span=token.span(self.filename))
-        if token := self._match(TokenType.FALSE):
-            return BoolLiteral(False, span=token.span(self.filename))
+        if ttype is TokenType.TRUE or ttype is TokenType.FALSE:
+            token = self.tokens[self.pos]
+            self.pos += 1
+            return BoolLiteral(ttype is TokenType.TRUE, span=token.span(self.filename))
         
         # Match expression
-        if match_token := self._match(TokenType.MATCH):
+        if ttype is TokenType.MATCH:
+            match_token = self.tokens[self.pos]
+            self.pos += 1
             return self._parse_match_expr(match_token)
         
         # List literal: [1, 2, 3]
-        if lbracket := self._match(TokenType.LBRACKET):
+        if ttype is TokenType.LBRACKET:
+            lbracket = self.tokens[self.pos]
+            self.pos += 1
             return self._parse_list_literal(lbracket)
         
-        # Identifier
-        if token := self._match(TokenType.IDENT):
-            return Identifier(token.value, span=token.span(self.filename))
-        
         # Grouped expression
-        if self._match(TokenType.LPAREN):
+        if ttype is TokenType.LPAREN:
+            self.pos += 1
             expr = self._parse_expr()
             self._expect(TokenType.RPAREN, "Expected ')' after expression")
             return expr
@@ -702,23 +743,17 @@ class Parser:
         if pattern_name == "None":
             return NonePattern(span=span)
         
-        if pattern_name in ("Some", "Ok", "Err"):
-            self._expect(TokenType.LPAREN, f"Expected '(' after {pattern_name}")
-            binding_token = self._expect(TokenType.IDENT, "Expected binding name")
-            binding = binding_token.value
-            self._expect(TokenType.RPAREN, f"Expected ')' after binding")
-            
-            if pattern_name == "Some":
-                return SomePattern(binding=binding, span=span)
-            elif pattern_name == "Ok":
-                return OkPattern(binding=binding, span=span)
-            else:  # Err
-                return ErrPattern(binding=binding, span=span)
-        
-        raise ParseError(
-            f"Unknown pattern '{pattern_name}'. Expected Some, None, Ok, or Err",
-            token
-        )
+        pattern_cls = _BINDING_PATTERNS.get(pattern_name)
+        if pattern_cls is None:
+            raise ParseError(
+                f"Unknown pattern '{pattern_name}'. Expected Some, None, Ok, or Err",
+                token
+            )
+        
+        self._expect(TokenType.LPAREN, f"Expected '(' after {pattern_name}")
+        binding_token = self._expect(TokenType.IDENT, "Expected binding name")
+        self._expect(TokenType.RPAREN, f"Expected ')' after binding")
+        return pattern_cls(binding=binding_token.value, span=span)
 
 
 def parse(tokens: list[Token], filename: str = "<unknown>") -> Program:
@@ -9,6 +9,9 @@ has passed type checking. It does not re-validate semantic rules.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 from ..ast import (
     # Expressions
     Expr, IntLiteral, FloatLiteral, StringLiteral, BoolLiteral,
@@ -22,7 +25,46 @@ from ..ast import (
     FnDecl, PythonImport, PythonFromImport, Program
 )
 
-from ..typechecker.builtins import get_builtin, is_type_constructor
+from ..typechecker.builtins import BUILTIN_FUNCTIONS
+
+# Escapes for emitting string literals in double quotes (single C-level pass).
+# Line breaks must be escaped too: a raw newline ends a "..." literal. Tabs
+# are escaped so they stay visible in the generated source.
+_STRING_ESCAPES = str.maketrans({
+    '\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t',
+})
+
+# Ok/Err runtime classes, emitted ahead of programs that use Result types.
+# Pre-rendered as one output line so it costs a single buffer insert.
+_RESULT_RUNTIME = """\
+# Result type runtime
+class Ok:
+    def __init__(self, value):
+        self.value = value
+    def __repr__(self):
+        return f"Ok({self.value!r})"
+
+class Err:
+    def __init__(self, error):
+        self.error = error
+    def __repr__(self):
+        return f"Err({self.error!r})"
+"""
+
+# Match pattern -> condition on the matched value ({0} is the match variable)
+_PATTERN_CONDITIONS: dict[type, str] = {
+    SomePattern: "{0} is not None and hasattr({0}, 'value')",
+    NonePattern: "{0} is None",
+    OkPattern: "isinstance({0}, Ok)",
+    ErrPattern: "isinstance({0}, Err)",
+}
+
+# Binding pattern -> attribute of the matched value its binding reads
+_PATTERN_BINDING_FIELDS: dict[type, str] = {
+    SomePattern: "value",
+    OkPattern: "value",
+    ErrPattern: "error",
+}
 
 
 class Transpiler:
@@ -38,16 +80,47 @@ class Transpiler:
         self.indent_level = 0
         self.indent_str = "    "  # 4 spaces
         self._try_counter = 0  # Counter for unique try expression variables
+        self._out: list[str] = []  # Output lines, joined once by transpile()
+        self._uses_result = False  # Set by emitters that need the Ok/Err runtime
+        self._rename: dict[str, str] = {}  # Match-arm bindings -> extraction code
+        self._indents: list[str] = [""]  # Indent prefix per level, grown lazily
+        self._prefix = ""  # _indents[indent_level], refreshed on level changes
+        
+        # Dispatch tables: node type -> handler (one dict lookup per node)
+        self._stmt_dispatch: dict[type, Callable[[Any], None]] = {
+            LetStmt: self._transpile_let,
+            AssignStmt: self._transpile_assign,
+            ExprStmt: self._transpile_expr_stmt,
+            ReturnStmt: self._transpile_return,
+            WhileStmt: self._transpile_while,
+            ForInStmt: self._transpile_for_in,
+            LoopStmt: self._transpile_loop,
+            BreakStmt: self._transpile_break,
+            ContinueStmt: self._transpile_continue,
+            IfStmt: self._transpile_if,
+        }
+        self._expr_dispatch: dict[type, Callable[[Any], str]] = {
+            IntLiteral: self._transpile_int,
+            FloatLiteral: self._transpile_float,
+            StringLiteral: self._transpile_string,
+            BoolLiteral: self._transpile_bool,
+            Identifier: self._transpile_identifier,
+            BinaryOp: self._transpile_binary_op,
+            UnaryOp: self._transpile_unary_op,
+            Call: self._transpile_call,
+            FieldAccess: self._transpile_field_access,
+            TryExpr: self._transpile_try_expr,
+            MatchExpr: self._transpile_match_expr,
+            ListLiteral: self._transpile_list,
+        }
     
     def transpile(self, program: Program) -> str:
         """Transpile entire program to Python."""
-        lines: list[str] = []
-        
-        # Check if we need the Result runtime (if any function uses Ok, Err, or ?)
-        needs_result_runtime = self._program_uses_result(program)
-        if needs_result_runtime:
-            lines.extend(self._generate_result_runtime())
-            lines.append("")
+        # Statement emitters append to this buffer; it is joined once at the end
+        lines = self._out = []
+        self._indents = [""]
+        self._sync_indent()
+        self._uses_result = False
         
         # Generate imports
         for imp in program.imports:
@@ -56,101 +129,31 @@ class Transpiler:
         if program.imports:
             lines.append("")  # Blank line after imports
         
-        # Generate functions
+        # Generate functions, noting whether a main() needs the entry guard
+        has_main = False
         for fn in program.functions:
-            lines.append(self._transpile_fn(fn))
+            if fn.name == "main":
+                has_main = True
+            self._transpile_fn(fn)
             lines.append("")  # Blank line between functions
         
         # Generate top-level statements (script mode)
-        for stmt in program.statements:
-            lines.append(self._transpile_stmt(stmt))
+        self._transpile_stmts(program.statements)
         
         # Add main guard if there's a main function
-        has_main = any(fn.name == "main" for fn in program.functions)
         if has_main:
             lines.append("")
             lines.append('if __name__ == "__main__":')
             lines.append(f"{self.indent_str}main()")
         
+        # The Result runtime goes first, but the emitters only find out
+        # whether it is needed (an Ok/Err call or a ?) on the way. Ok/Err
+        # patterns alone don't need it: matched values may come from outside.
+        if self._uses_result:
+            lines.insert(0, _RESULT_RUNTIME)
+        
         return "\n".join(lines)
     
-    def _program_uses_result(self, program: Program) -> bool:
-        """Check if the program uses Result types (TryExpr, Ok, or Err)."""
-        for fn in program.functions:
-            for stmt in fn.body:
-                if self._stmt_has_result(stmt):
-                    return True
-        for stmt in program.statements:
-            if self._stmt_has_result(stmt):
-                return True
-        return False
-    
-    def _stmt_has_result(self, stmt: Stmt) -> bool:
-        """Check if a statement contains Result usage."""
-        if isinstance(stmt, LetStmt):
-            return self._expr_has_result(stmt.value)
-        elif isinstance(stmt, AssignStmt):
-            return self._expr_has_result(stmt.value)
-        elif isinstance(stmt, ExprStmt):
-            return self._expr_has_result(stmt.expr)
-        elif isinstance(stmt, ReturnStmt):
-            return stmt.value is not None and self._expr_has_result(stmt.value)
-        elif isinstance(stmt, WhileStmt):
-            if self._expr_has_result(stmt.condition):
-                return True
-            for s in stmt.body:
-                if self._stmt_has_result(s):
-                    return True
-        elif isinstance(stmt, IfStmt):
-            if self._expr_has_result(stmt.condition):
-                return True
-            for s in stmt.then_body:
-                if self._stmt_has_result(s):
-                    return True
-            if stmt.else_body:
-                for s in stmt.else_body:
-                    if self._stmt_has_result(s):
-                        return True
-        return False
-    
-    def _expr_has_result(self, expr: Expr) -> bool:
-        """Check if an expression contains Result usage (TryExpr, Ok, Err)."""
-        if isinstance(expr, TryExpr):
-            return True
-        elif isinstance(expr, Call):
-            # Check for Ok(...) or Err(...) calls
-            if isinstance(expr.callee, Identifier) and expr.callee.name in ("Ok", "Err"):
-                return True
-            if self._expr_has_result(expr.callee):
-                return True
-            for arg in expr.arguments:
-                if self._expr_has_result(arg):
-                    return True
-        elif isinstance(expr, BinaryOp):
-            return self._expr_has_result(expr.left) or self._expr_has_result(expr.right)
-        elif isinstance(expr, UnaryOp):
-            return self._expr_has_result(expr.operand)
-        elif isinstance(expr, FieldAccess):
-            return self._expr_has_result(expr.object)
-        return False
-    
-    def _generate_result_runtime(self) -> list[str]:
-        """Generate the Ok/Err runtime classes for Result type support."""
-        return [
-            "# Result type runtime",
-            "class Ok:",
-            "    def __init__(self, value):",
-            "        self.value = value",
-            "    def __repr__(self):",
-            "        return f\"Ok({self.value!r})\"",
-            "",
-            "class Err:",
-            "    def __init__(self, error):",
-            "        self.error = error",
-            "    def __repr__(self):",
-            "        return f\"Err({self.error!r})\"",
-        ]
-    
     # =========================================================================
     # Import Transpilation
     # =========================================================================
@@ -165,13 +168,10 @@ class Transpiler:
         
         elif isinstance(imp, PythonFromImport):
             # from python.os.path import join, exists
-            names: list[str] = []
-            for name, alias in imp.names:
-                if alias:
-                    names.append(f"{name} as {alias}")
-                else:
-                    names.append(name)
-            return f"from {imp.module} import {', '.join(names)}"
+            names = ", ".join([
+                f"{name} as {alias}" if alias else name for name, alias in imp.names
+            ])
+            return f"from {imp.module} import {names}"
         
         return ""
     
@@ -179,47 +179,51 @@ class Transpiler:
     # Function Transpilation
     # =========================================================================
     
-    def _transpile_fn(self, fn: FnDecl) -> str:
+    def _transpile_fn(self, fn: FnDecl) -> None:
         """Transpile function declaration.
         
         Handles implicit return: if the last statement is an expression,
         it is treated as the return value.
         """
         # Function signature
-        params = ", ".join(p.name for p in fn.params)
-        lines: list[str] = [f"def {fn.name}({params}):"]
+        fn_params = fn.params
+        if not fn_params:
+            params = ""
+        elif len(fn_params) == 1:
+            params = fn_params[0].name
+        else:
+            params = ", ".join([p.name for p in fn_params])
+        self._emit(f"def {fn.name}({params}):")
         
         # Function body
-        self.indent_level += 1
+        self._push_indent()
         
         if not fn.body:
-            lines.append(self._indent("pass"))
+            self._emit("pass")
         else:
             # Transpile all statements except the last
-            for stmt in fn.body[:-1]:
-                lines.append(self._transpile_stmt(stmt))
+            self._transpile_stmts(fn.body[:-1])
             
             # Handle last statement specially for implicit return
-            last_stmt = fn.body[-1]
-            if isinstance(last_stmt, ExprStmt):
-                # Last expression becomes implicit return
-                expr_code = self._transpile_expr(last_stmt.expr)
-                lines.append(self._indent(f"return {expr_code}"))
-            elif isinstance(last_stmt, ReturnStmt):
-                # Explicit return, transpile normally
-                lines.append(self._transpile_stmt(last_stmt))
-            elif isinstance(last_stmt, IfStmt):
-                # if/else as last statement - treat as expression return
-                lines.append(self._transpile_if_as_return(last_stmt))
-            else:
-                # Other statements (let)
-                lines.append(self._transpile_stmt(last_stmt))
-        
-        self.indent_level -= 1
-        
-        return "\n".join(lines)
+            self._transpile_tail(fn.body[-1])
+        
+        self._pop_indent()
+    
+    def _transpile_tail(self, stmt: Stmt) -> None:
+        """Transpile the last statement of a body whose value is returned."""
+        stmt_type = type(stmt)
+        if stmt_type is ExprStmt:
+            # Last expression becomes implicit return
+            expr_code = self._transpile_expr(stmt.expr)
+            self._emit(f"return {expr_code}")
+        elif stmt_type is IfStmt:
+            # if/else as last statement - treat as expression return
+            self._transpile_if_as_return(stmt)
+        else:
+            # Explicit return or other statements (let): transpile normally
+            self._transpile_stmt(stmt)
     
-    def _transpile_if_as_return(self, stmt: IfStmt) -> str:
+    def _transpile_if_as_return(self, stmt: IfStmt) -> None:
         """Transpile if/else as a returning expression.
         
         Generates:
@@ -228,184 +232,153 @@ class Transpiler:
             else:
                 return <last expr in else>
         """
-        lines: list[str] = []
         condition = self._transpile_expr(stmt.condition)
-        lines.append(self._indent(f"if {condition}:"))
+        self._emit(f"if {condition}:")
         
         # Then branch
-        self.indent_level += 1
+        self._push_indent()
         if stmt.then_body:
             # All but last statement
-            for s in stmt.then_body[:-1]:
-                lines.append(self._transpile_stmt(s))
+            self._transpile_stmts(stmt.then_body[:-1])
             # Last statement becomes return
-            last_then = stmt.then_body[-1]
-            if isinstance(last_then, ExprStmt):
-                expr_code = self._transpile_expr(last_then.expr)
-                lines.append(self._indent(f"return {expr_code}"))
-            elif isinstance(last_then, IfStmt):
-                lines.append(self._transpile_if_as_return(last_then))
-            else:
-                lines.append(self._transpile_stmt(last_then))
+            self._transpile_tail(stmt.then_body[-1])
         else:
-            lines.append(self._indent("pass"))
-        self.indent_level -= 1
+            self._emit("pass")
+        self._pop_indent()
         
         # Else branch
         if stmt.else_body:
-            lines.append(self._indent("else:"))
-            self.indent_level += 1
+            self._emit("else:")
+            self._push_indent()
             # All but last statement
-            for s in stmt.else_body[:-1]:
-                lines.append(self._transpile_stmt(s))
+            self._transpile_stmts(stmt.else_body[:-1])
             # Last statement becomes return
-            last_else = stmt.else_body[-1]
-            if isinstance(last_else, ExprStmt):
-                expr_code = self._transpile_expr(last_else.expr)
-                lines.append(self._indent(f"return {expr_code}"))
-            elif isinstance(last_else, IfStmt):
-                lines.append(self._transpile_if_as_return(last_else))
-            else:
-                lines.append(self._transpile_stmt(last_else))
-            self.indent_level -= 1
-        
-        return "\n".join(lines)
+            self._transpile_tail(stmt.else_body[-1])
+            self._pop_indent()
     
     # =========================================================================
     # Statement Transpilation
     # =========================================================================
     
-    def _transpile_stmt(self, stmt: Stmt) -> str:
-        """Transpile a statement."""
-        if isinstance(stmt, LetStmt):
-            return self._transpile_let(stmt)
-        elif isinstance(stmt, AssignStmt):
-            return self._transpile_assign(stmt)
-        elif isinstance(stmt, ExprStmt):
-            return self._transpile_expr_stmt(stmt)
-        elif isinstance(stmt, ReturnStmt):
-            return self._transpile_return(stmt)
-        elif isinstance(stmt, WhileStmt):
-            return self._transpile_while(stmt)
-        elif isinstance(stmt, ForInStmt):
-            return self._transpile_for_in(stmt)
-        elif isinstance(stmt, LoopStmt):
-            return self._transpile_loop(stmt)
-        elif isinstance(stmt, BreakStmt):
-            return self._transpile_break(stmt)
-        elif isinstance(stmt, ContinueStmt):
-            return self._transpile_continue(stmt)
-        elif isinstance(stmt, IfStmt):
-            return self._transpile_if(stmt)
-        else:
+    def _transpile_stmt(self, stmt: Stmt) -> None:
+        """Transpile a statement, appending its lines to the output buffer."""
+        handler = self._stmt_dispatch.get(type(stmt))
+        if handler is None:
             raise ValueError(f"Unknown statement type: {type(stmt)}")
+        handler(stmt)
+    
+    def _transpile_stmts(self, stmts: list[Stmt]) -> None:
+        """Transpile a run of statements, calling their handlers directly."""
+        get_handler = self._stmt_dispatch.get
+        for stmt in stmts:
+            handler = get_handler(type(stmt))
+            if handler is None:
+                self._transpile_stmt(stmt)  # Raises for unknown statement types
+            else:
+                handler(stmt)
     
-    def _transpile_let(self, stmt: LetStmt) -> str:
+    def _transpile_let(self, stmt: LetStmt) -> None:
         """Transpile: let x = value → x = value
         
         Special handling for try expressions (?) to enable early return.
         Note: 'mut' doesn't affect Python output - mutability is enforced at compile time.
         """
         # Check if value contains TryExpr and handle specially
-        if isinstance(stmt.value, TryExpr):
-            return self._transpile_let_with_try(stmt.name, stmt.value)
+        if type(stmt.value) is TryExpr:
+            self._transpile_let_with_try(stmt.name, stmt.value)
+            return
         
         value = self._transpile_expr(stmt.value)
-        return self._indent(f"{stmt.name} = {value}")
+        self._emit(f"{stmt.name} = {value}")
     
-    def _transpile_assign(self, stmt: AssignStmt) -> str:
+    def _transpile_assign(self, stmt: AssignStmt) -> None:
         """Transpile: x = value → x = value (assignment to mutable variable)."""
         value = self._transpile_expr(stmt.value)
-        return self._indent(f"{stmt.name} = {value}")
+        self._emit(f"{stmt.name} = {value}")
     
-    def _transpile_while(self, stmt: WhileStmt) -> str:
+    def _transpile_while(self, stmt: WhileStmt) -> None:
         """Transpile: while condition { body } → while condition: body"""
-        lines: list[str] = []
         condition = self._transpile_expr(stmt.condition)
-        lines.append(self._indent(f"while {condition}:"))
-        
-        self.indent_level += 1
-        if stmt.body:
-            for s in stmt.body:
-                lines.append(self._transpile_stmt(s))
-        else:
-            lines.append(self._indent("pass"))
-        self.indent_level -= 1
-        
-        return "\n".join(lines)
+        self._emit(f"while {condition}:")
+        self._transpile_block(stmt.body)
     
-    def _transpile_break(self, stmt: BreakStmt) -> str:
+    def _transpile_break(self, stmt: BreakStmt) -> None:
         """Transpile: break → break"""
-        return self._indent("break")
+        self._emit("break")
     
-    def _transpile_continue(self, stmt: ContinueStmt) -> str:
+    def _transpile_continue(self, stmt: ContinueStmt) -> None:
         """Transpile: continue → continue"""
-        return self._indent("continue")
+        self._emit("continue")
     
-    def _transpile_for_in(self, stmt: ForInStmt) -> str:
+    def _transpile_for_in(self, stmt: ForInStmt) -> None:
         """Transpile: for item in collection { body } → for item in collection: body"""
-        lines: list[str] = []
         collection = self._transpile_expr(stmt.collection)
-        lines.append(self._indent(f"for {stmt.item_name} in {collection}:"))
-        
-        self.indent_level += 1
-        if stmt.body:
-            for s in stmt.body:
-                lines.append(self._transpile_stmt(s))
-        else:
-            lines.append(self._indent("pass"))
-        self.indent_level -= 1
-        
-        return "\n".join(lines)
+        self._emit(f"for {stmt.item_name} in {collection}:")
+        self._transpile_block(stmt.body)
     
-    def _transpile_loop(self, stmt: LoopStmt) -> str:
+    def _transpile_loop(self, stmt: LoopStmt) -> None:
         """Transpile: loop { body } → while True: body"""
-        lines: list[str] = []
-        lines.append(self._indent("while True:"))
-        
-        self.indent_level += 1
-        if stmt.body:
-            for s in stmt.body:
-                lines.append(self._transpile_stmt(s))
+        self._emit("while True:")
+        self._transpile_block(stmt.body)
+    
+    def _transpile_block(self, body: list[Stmt]) -> None:
+        """Transpile an indented loop body, emitting `pass` if it is empty."""
+        self._push_indent()
+        if body:
+            self._transpile_stmts(body)
         else:
-            lines.append(self._indent("pass"))
-        self.indent_level -= 1
-        
-        return "\n".join(lines)
+            self._emit("pass")
+        self._pop_indent()
     
-    def _transpile_let_with_try(self, var_name: str, try_expr: TryExpr) -> str:
+    def _emit_try_prefix(self, try_expr: TryExpr) -> str:
         """
-        Transpile: let x = expr? 
+        Emit the early-return prefix shared by every statement-level `?`.
         
         Generates:
             __try_N = expr
             if isinstance(__try_N, Err):
                 return __try_N
-            x = __try_N.value
+        
+        Returns the temporary's name, for callers that go on to unwrap it.
         """
-        lines: list[str] = []
         tmp_var = f"__try_{self._try_counter}"
         self._try_counter += 1
+        self._uses_result = True
         
         operand = self._transpile_expr(try_expr.operand)
         
-        lines.append(self._indent(f"{tmp_var} = {operand}"))
-        lines.append(self._indent(f"if isinstance({tmp_var}, Err):"))
-        self.indent_level += 1
-        lines.append(self._indent(f"return {tmp_var}"))
-        self.indent_level -= 1
-        lines.append(self._indent(f"{var_name} = {tmp_var}.value"))
+        # Fixed three-line shape: write it in one go at the cached prefix
+        # rather than three _emit calls around an indent push/pop
+        prefix = self._prefix
+        self._out.extend((
+            f"{prefix}{tmp_var} = {operand}",
+            f"{prefix}if isinstance({tmp_var}, Err):",
+            f"{prefix}{self.indent_str}return {tmp_var}",
+        ))
+        return tmp_var
+    
+    def _transpile_let_with_try(self, var_name: str, try_expr: TryExpr) -> None:
+        """
+        Transpile: let x = expr? 
         
-        return "\n".join(lines)
+        Generates:
+            __try_N = expr
+            if isinstance(__try_N, Err):
+                return __try_N
+            x = __try_N.value
+        """
+        tmp_var = self._emit_try_prefix(try_expr)
+        self._emit(f"{var_name} = {tmp_var}.value")
     
-    def _transpile_expr_stmt(self, stmt: ExprStmt) -> str:
+    def _transpile_expr_stmt(self, stmt: ExprStmt) -> None:
         """Transpile expression statement."""
         # Handle try expression in statement position
-        if isinstance(stmt.expr, TryExpr):
-            return self._transpile_try_stmt(stmt.expr)
-        return self._indent(self._transpile_expr(stmt.expr))
+        if type(stmt.expr) is TryExpr:
+            self._transpile_try_stmt(stmt.expr)
+            return
+        self._emit(self._transpile_expr(stmt.expr))
     
-    def _transpile_try_stmt(self, try_expr: TryExpr) -> str:
+    def _transpile_try_stmt(self, try_expr: TryExpr) -> None:
         """
         Transpile a try expression in statement position (result discarded).
         
@@ -414,31 +387,21 @@ class Transpiler:
             if isinstance(__try_N, Err):
                 return __try_N
         """
-        lines: list[str] = []
-        tmp_var = f"__try_{self._try_counter}"
-        self._try_counter += 1
-        
-        operand = self._transpile_expr(try_expr.operand)
-        
-        lines.append(self._indent(f"{tmp_var} = {operand}"))
-        lines.append(self._indent(f"if isinstance({tmp_var}, Err):"))
-        self.indent_level += 1
-        lines.append(self._indent(f"return {tmp_var}"))
-        self.indent_level -= 1
-        
-        return "\n".join(lines)
+        self._emit_try_prefix(try_expr)
     
-    def _transpile_return(self, stmt: ReturnStmt) -> str:
+    def _transpile_return(self, stmt: ReturnStmt) -> None:
         """Transpile return statement."""
         if stmt.value:
             # Handle try expression in return
-            if isinstance(stmt.value, TryExpr):
-                return self._transpile_return_with_try(stmt.value)
+            if type(stmt.value) is TryExpr:
+                self._transpile_return_with_try(stmt.value)
+                return
             value = self._transpile_expr(stmt.value)
-            return self._indent(f"return {value}")
-        return self._indent("return")
+            self._emit(f"return {value}")
+            return
+        self._emit("return")
     
-    def _transpile_return_with_try(self, try_expr: TryExpr) -> str:
+    def _transpile_return_with_try(self, try_expr: TryExpr) -> None:
         """
         Transpile: return expr?
         
@@ -448,44 +411,26 @@ class Transpiler:
                 return __try_N
             return __try_N.value
         """
-        lines: list[str] = []
-        tmp_var = f"__try_{self._try_counter}"
-        self._try_counter += 1
-        
-        operand = self._transpile_expr(try_expr.operand)
-        
-        lines.append(self._indent(f"{tmp_var} = {operand}"))
-        lines.append(self._indent(f"if isinstance({tmp_var}, Err):"))
-        self.indent_level += 1
-        lines.append(self._indent(f"return {tmp_var}"))
-        self.indent_level -= 1
-        lines.append(self._indent(f"return {tmp_var}.value"))
-        
-        return "\n".join(lines)
+        tmp_var = self._emit_try_prefix(try_expr)
+        self._emit(f"return {tmp_var}.value")
     
-    def _transpile_if(self, stmt: IfStmt) -> str:
+    def _transpile_if(self, stmt: IfStmt) -> None:
         """Transpile if statement."""
-        lines: list[str] = []
-        
         # If condition
         condition = self._transpile_expr(stmt.condition)
-        lines.append(self._indent(f"if {condition}:"))
+        self._emit(f"if {condition}:")
         
         # Then body
-        self.indent_level += 1
-        for s in stmt.then_body:
-            lines.append(self._transpile_stmt(s))
-        self.indent_level -= 1
+        self._push_indent()
+        self._transpile_stmts(stmt.then_body)
+        self._pop_indent()
         
         # Else body
         if stmt.else_body:
-            lines.append(self._indent("else:"))
-            self.indent_level += 1
-            for s in stmt.else_body:
-                lines.append(self._transpile_stmt(s))
-            self.indent_level -= 1
-        
-        return "\n".join(lines)
+            self._emit("else:")
+            self._push_indent()
+            self._transpile_stmts(stmt.else_body)
+            self._pop_indent()
     
     # =========================================================================
     # Expression Transpilation
@@ -493,77 +438,162 @@ class Transpiler:
     
     def _transpile_expr(self, expr: Expr) -> str:
         """Transpile an expression."""
-        if isinstance(expr, IntLiteral):
-            return str(expr.value)
-        
-        elif isinstance(expr, FloatLiteral):
-            return str(expr.value)
-        
-        elif isinstance(expr, StringLiteral):
-            # Escape special characters and wrap in quotes
-            escaped = expr.value.replace('\\', '\\\\').replace('"', '\\"')
-            return f'"{escaped}"'
-        
-        elif isinstance(expr, BoolLiteral):
-            return "True" if expr.value else "False"
-        
-        elif isinstance(expr, Identifier):
-            return expr.name
-        
-        elif isinstance(expr, BinaryOp):
-            left = self._transpile_expr(expr.left)
-            right = self._transpile_expr(expr.right)
-            return f"({left} {expr.operator} {right})"
-        
-        elif isinstance(expr, UnaryOp):
-            operand = self._transpile_expr(expr.operand)
-            return f"({expr.operator}{operand})"
-        
-        elif isinstance(expr, Call):
-            # Handle built-in functions using registry
-            if isinstance(expr.callee, Identifier):
-                callee_name = expr.callee.name
-                builtin = get_builtin(callee_name)
-                
-                if builtin and builtin.transpile_template:
-                    # Use template from builtins registry
-                    args = [self._transpile_expr(arg) for arg in expr.arguments]
-                    return builtin.transpile_template.format(*args)
-                
-                # Special case: print can have any number of args
-                # (template only handles single arg)
-                if callee_name == "print":
-                    args = ", ".join(self._transpile_expr(arg) for arg in expr.arguments)
-                    return f"print({args})"
-            
-            callee = self._transpile_expr(expr.callee)
-            args = ", ".join(self._transpile_expr(arg) for arg in expr.arguments)
-            return f"{callee}({args})"
-        
-        elif isinstance(expr, FieldAccess):
-            obj = self._transpile_expr(expr.object)
-            return f"{obj}.{expr.field}"
-        
-        elif isinstance(expr, TryExpr):
-            # For try expressions used within other expressions (e.g., foo()? + bar()),
-            # we generate a simple value extraction. The early-return semantics
-            # are handled at the statement level for let/return/expr statements.
-            # 
-            # For nested try expressions in complex expressions, this provides
-            # the value extraction, but won't do early return. The type checker
-            # ensures this is only used with Result types.
-            operand = self._transpile_expr(expr.operand)
-            return f"({operand}).value"
-        
-        elif isinstance(expr, MatchExpr):
-            return self._transpile_match_expr(expr)
-        
-        elif isinstance(expr, ListLiteral):
-            elements = ", ".join(self._transpile_expr(e) for e in expr.elements)
-            return f"[{elements}]"
-        
-        else:
+        handler = self._expr_dispatch.get(type(expr))
+        if handler is None:
             raise ValueError(f"Unknown expression type: {type(expr)}")
+        return handler(expr)
+    
+    def _transpile_int(self, expr: IntLiteral) -> str:
+        """Transpile: 42 → 42"""
+        return str(expr.value)
+    
+    def _transpile_float(self, expr: FloatLiteral) -> str:
+        """Transpile: 3.14 → 3.14"""
+        return str(expr.value)
+    
+    def _transpile_string(self, expr: StringLiteral) -> str:
+        """Transpile: "hi" → "hi" (with escaping)"""
+        # Escape special characters and wrap in quotes
+        return f'"{expr.value.translate(_STRING_ESCAPES)}"'
+    
+    def _transpile_bool(self, expr: BoolLiteral) -> str:
+        """Transpile: true/false → True/False"""
+        return "True" if expr.value else "False"
+    
+    def _transpile_identifier(self, expr: Identifier) -> str:
+        """Transpile: x → x (or the extraction a match arm binds x to)"""
+        return self._rename.get(expr.name, expr.name)
+    
+    def _transpile_binary_op(self, expr: BinaryOp) -> str:
+        """Transpile: a + b → (a + b)"""
+        return self._transpile_compound(expr)
+    
+    def _transpile_unary_op(self, expr: UnaryOp) -> str:
+        """Transpile: -x → (-x)"""
+        return self._transpile_compound(expr)
+    
+    def _transpile_compound(self, expr: Expr) -> str:
+        """
+        Transpile nested operators, calls and field accesses without
+        recursing per node.
+        
+        The parser builds long operator chains (1 + 2 + ... + n) iteratively,
+        so they can be far deeper than the recursion limit. Operators, plain
+        calls and field accesses are walked in postorder with an explicit
+        stack; identifiers and literals are emitted in place and any other
+        operand goes through the normal dispatch.
+        """
+        rename = self._rename
+        out: list[str] = []
+        stack: list[tuple[Expr, bool]] = [(expr, False)]
+        # Bound methods hoisted out of the per-node loop
+        push = stack.append
+        emit = out.append
+        while stack:
+            node, operands_done = stack.pop()
+            node_type = type(node)
+            if node_type is BinaryOp:
+                if operands_done:
+                    right = out.pop()
+                    left = out.pop()
+                    emit(f"({left} {node.operator} {right})")
+                else:
+                    push((node, True))
+                    push((node.right, False))
+                    push((node.left, False))
+            elif node_type is UnaryOp:
+                if operands_done:
+                    emit(f"({node.operator}{out.pop()})")
+                else:
+                    push((node, True))
+                    push((node.operand, False))
+            elif node_type is Identifier:
+                # The most common operands are emitted inline, saving the
+                # _transpile_expr -> handler call pair per leaf
+                name = node.name
+                emit(rename.get(name, name))
+            elif node_type is IntLiteral or node_type is FloatLiteral:
+                emit(str(node.value))
+            elif node_type is StringLiteral:
+                emit(f'"{node.value.translate(_STRING_ESCAPES)}"')
+            elif node_type is BoolLiteral:
+                emit("True" if node.value else "False")
+            elif node_type is Call:
+                if operands_done:
+                    # Callee first, then one entry per argument
+                    split = len(out) - len(node.arguments)
+                    args = ", ".join(out[split:])
+                    del out[split:]
+                    emit(f"{out.pop()}({args})")
+                else:
+                    code = self._transpile_builtin_call(node)
+                    if code is not None:
+                        emit(code)
+                    else:
+                        push((node, True))
+                        stack.extend([(arg, False) for arg in reversed(node.arguments)])
+                        push((node.callee, False))
+            elif node_type is FieldAccess:
+                if operands_done:
+                    emit(f"{out.pop()}.{node.field}")
+                else:
+                    push((node, True))
+                    push((node.object, False))
+            else:
+                emit(self._transpile_expr(node))
+        return out[0]
+    
+    def _transpile_call(self, expr: Call) -> str:
+        """Transpile function call, expanding built-in templates."""
+        code = self._transpile_builtin_call(expr)
+        if code is None:
+            code = self._transpile_compound(expr)
+        return code
+    
+    def _transpile_builtin_call(self, expr: Call) -> str | None:
+        """Expand a call to a built-in, or return None for a plain call."""
+        # Handle built-in functions using registry
+        if type(expr.callee) is Identifier:
+            callee_name = expr.callee.name
+            if callee_name == "Ok" or callee_name == "Err":
+                self._uses_result = True
+            builtin = BUILTIN_FUNCTIONS.get(callee_name)
+            
+            if builtin is not None and builtin.transpile_template:
+                # Use template from builtins registry
+                return builtin.transpile_template.format(
+                    *map(self._transpile_expr, expr.arguments)
+                )
+            
+            # Special case: print can have any number of args
+            # (template only handles single arg)
+            if callee_name == "print":
+                args = ", ".join(map(self._transpile_expr, expr.arguments))
+                return f"print({args})"
+        
+        return None
+    
+    def _transpile_field_access(self, expr: FieldAccess) -> str:
+        """Transpile: obj.field → obj.field"""
+        return self._transpile_compound(expr)
+    
+    def _transpile_try_expr(self, expr: TryExpr) -> str:
+        """Transpile: expr? inside a larger expression → (expr).value"""
+        # For try expressions used within other expressions (e.g., foo()? + bar()),
+        # we generate a simple value extraction. The early-return semantics
+        # are handled at the statement level for let/return/expr statements.
+        # 
+        # For nested try expressions in complex expressions, this provides
+        # the value extraction, but won't do early return. The type checker
+        # ensures this is only used with Result types.
+        self._uses_result = True
+        operand = self._transpile_expr(expr.operand)
+        return f"({operand}).value"
+    
+    def _transpile_list(self, expr: ListLiteral) -> str:
+        """Transpile: [1, 2, 3] → [1, 2, 3]"""
+        elements = ", ".join(map(self._transpile_expr, expr.elements))
+        return f"[{elements}]"
     
     def _transpile_match_expr(self, expr: MatchExpr) -> str:
         """
@@ -585,82 +615,83 @@ class Transpiler:
         match_var = f"__match_{self._try_counter}"
         self._try_counter += 1
         
-        # Build a conditional expression chain
-        # We process arms in order, generating:
+        # Build a conditional expression chain, folding from the right:
         # (body1 if condition1 else (body2 if condition2 else ...))
-        
-        def build_conditional(arms: list[MatchArm]) -> str:
-            if not arms:
-                return "None"  # Fallback, shouldn't happen with exhaustive match
-            
-            arm = arms[0]
-            remaining = arms[1:]
-            
-            condition = self._pattern_condition(arm.pattern, match_var)
-            
-            # For patterns with bindings, we need to extract the value
-            body = self._transpile_arm_body(arm, match_var)
-            
-            if not remaining:
-                # Last arm - no else needed (exhaustive match)
-                return body
-            else:
-                rest = build_conditional(remaining)
-                return f"({body} if {condition} else {rest})"
+        # Arms are emitted in source order first, so nested matches number
+        # their temporaries the same way regardless of the fold direction.
+        if not expr.arms:
+            conditional = "None"  # Fallback, shouldn't happen with exhaustive match
+        else:
+            # For patterns with bindings, the body extracts the value
+            parts = [
+                (self._pattern_condition(arm.pattern, match_var),
+                 self._transpile_arm_body(arm, match_var))
+                for arm in expr.arms
+            ]
+            # Last arm - no else needed (exhaustive match)
+            conditional = parts[-1][1]
+            for condition, body in reversed(parts[:-1]):
+                conditional = f"({body} if {condition} else {conditional})"
         
         # Generate: (lambda __match_N: conditional)(__subject)
-        conditional = build_conditional(expr.arms)
         return f"((lambda {match_var}: {conditional})({subject}))"
     
     def _pattern_condition(self, pattern: Pattern, match_var: str) -> str:
         """Generate condition for a pattern."""
-        if isinstance(pattern, SomePattern):
-            # Some(x) matches if match_var is not None and has .value
-            return f"{match_var} is not None and hasattr({match_var}, 'value')"
-        elif isinstance(pattern, NonePattern):
-            return f"{match_var} is None"
-        elif isinstance(pattern, OkPattern):
-            return f"isinstance({match_var}, Ok)"
-        elif isinstance(pattern, ErrPattern):
-            return f"isinstance({match_var}, Err)"
-        else:
+        template = _PATTERN_CONDITIONS.get(type(pattern))
+        if template is None:
             return "True"  # Fallback
+        return template.format(match_var)
     
     def _transpile_arm_body(self, arm: MatchArm, match_var: str) -> str:
         """Transpile arm body, substituting pattern bindings."""
-        import re
         pattern = arm.pattern
-        body_expr = self._transpile_expr(arm.body)
-        
-        def replace_identifier(expr: str, old: str, new: str) -> str:
-            """Replace identifier only when it's a complete word."""
-            # Use word boundaries to only match complete identifiers
-            return re.sub(rf'\b{re.escape(old)}\b', new, expr)
-        
-        # Replace the binding with the appropriate extraction
-        if isinstance(pattern, SomePattern):
-            # Some(v) => body where v is match_var.value
-            binding = pattern.binding
-            body_expr = replace_identifier(body_expr, binding, f"{match_var}.value")
-        elif isinstance(pattern, OkPattern):
-            # Ok(v) => body where v is match_var.value
-            binding = pattern.binding
-            body_expr = replace_identifier(body_expr, binding, f"{match_var}.value")
-        elif isinstance(pattern, ErrPattern):
-            # Err(e) => body where e is match_var.error
-            binding = pattern.binding
-            body_expr = replace_identifier(body_expr, binding, f"{match_var}.error")
-        # NonePattern has no binding
-        
-        return body_expr
+        
+        # Bind the pattern variable to the matching extraction while the body
+        # is emitted: Some(v)/Ok(v) read match_var.value, Err(e) match_var.error
+        field = _PATTERN_BINDING_FIELDS.get(type(pattern))
+        if field is None:
+            # NonePattern has no binding
+            return self._transpile_expr(arm.body)
+        binding = pattern.binding
+        access = f"{match_var}.{field}"
+        
+        rename = self._rename
+        shadowed = rename.get(binding)
+        rename[binding] = access
+        try:
+            return self._transpile_expr(arm.body)
+        finally:
+            if shadowed is None:
+                del rename[binding]
+            else:
+                rename[binding] = shadowed
     
     # =========================================================================
     # Helpers
     # =========================================================================
     
-    def _indent(self, line: str) -> str:
-        """Add current indentation to a line."""
-        return f"{self.indent_str * self.indent_level}{line}"
+    def _push_indent(self) -> None:
+        """Enter a nested block."""
+        self.indent_level += 1
+        self._sync_indent()
+    
+    def _pop_indent(self) -> None:
+        """Leave a nested block."""
+        self.indent_level -= 1
+        self._sync_indent()
+    
+    def _sync_indent(self) -> None:
+        """Refresh the cached prefix for the current indent_level."""
+        indents = self._indents
+        level = self.indent_level
+        while len(indents) <= level:
+            indents.append(indents[-1] + self.indent_str)
+        self._prefix = indents[level]
+    
+    def _emit(self, line: str) -> None:
+        """Append a line at the current indentation to the output buffer."""
+        self._out.append(self._prefix + line)
 
 
 def transpile(program: Program) -> str:
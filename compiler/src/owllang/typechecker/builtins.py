@@ -15,7 +15,9 @@ Each built-in defines:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable
 
 from .types import (
@@ -24,7 +26,7 @@ from .types import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuiltinFunction:
     """
     Definition of a built-in function.
@@ -49,74 +51,65 @@ class BuiltinFunction:
 # Built-in Function Definitions
 # =============================================================================
 
-BUILTIN_FUNCTIONS: dict[str, BuiltinFunction] = {}
-
-
-def _register(fn: BuiltinFunction) -> BuiltinFunction:
-    """Register a built-in function."""
-    BUILTIN_FUNCTIONS[fn.name] = fn
-    return fn
-
-
-# I/O Functions
-_register(BuiltinFunction(
-    name="print",
-    param_types=(ANY,),
-    return_type=VOID,
-    transpile_template="print({0})",
-    doc="Print a value to stdout.",
-))
-
-# List Functions
-_register(BuiltinFunction(
-    name="len",
-    param_types=(ListType(ANY),),
-    return_type=INT,
-    transpile_template="len({0})",
-    doc="Return the length of a list.",
-))
-
-_register(BuiltinFunction(
-    name="is_empty",
-    param_types=(ListType(ANY),),
-    return_type=BOOL,
-    transpile_template="len({0}) == 0",
-    doc="Return True if the list is empty.",
-))
-
-_register(BuiltinFunction(
-    name="get",
-    param_types=(ListType(ANY), INT),
-    return_type=ANY,  # Actual type computed from list element type
-    transpile_template="{0}[{1}]",
-    doc="Get element at index from list.",
-    generic_return=True,
-))
-
-_register(BuiltinFunction(
-    name="push",
-    param_types=(ListType(ANY), ANY),
-    return_type=ListType(ANY),  # Returns new list with same element type
-    transpile_template="{0} + [{1}]",
-    doc="Return a new list with element appended.",
-    generic_return=True,
-))
-
-# Range Function
-_register(BuiltinFunction(
-    name="range",
-    param_types=(INT, INT),
-    return_type=ListType(INT),
-    transpile_template="range({0}, {1})",
-    doc="Create a range from start to end (exclusive).",
-))
+# Read-only view: the registry is fixed once the module is imported.
+BUILTIN_FUNCTIONS: Mapping[str, BuiltinFunction] = MappingProxyType({
+    # I/O Functions
+    "print": BuiltinFunction(
+        name="print",
+        param_types=(ANY,),
+        return_type=VOID,
+        transpile_template="print({0})",
+        doc="Print a value to stdout.",
+    ),
+
+    # List Functions
+    "len": BuiltinFunction(
+        name="len",
+        param_types=(ListType(ANY),),
+        return_type=INT,
+        transpile_template="len({0})",
+        doc="Return the length of a list.",
+    ),
+    "is_empty": BuiltinFunction(
+        name="is_empty",
+        param_types=(ListType(ANY),),
+        return_type=BOOL,
+        transpile_template="len({0}) == 0",
+        doc="Return True if the list is empty.",
+    ),
+    "get": BuiltinFunction(
+        name="get",
+        param_types=(ListType(ANY), INT),
+        return_type=ANY,  # Actual type computed from list element type
+        transpile_template="{0}[{1}]",
+        doc="Get element at index from list.",
+        generic_return=True,
+    ),
+    "push": BuiltinFunction(
+        name="push",
+        param_types=(ListType(ANY), ANY),
+        return_type=ListType(ANY),  # Returns new list with same element type
+        transpile_template="{0} + [{1}]",
+        doc="Return a new list with element appended.",
+        generic_return=True,
+    ),
+
+    # Range Function
+    "range": BuiltinFunction(
+        name="range",
+        param_types=(INT, INT),
+        return_type=ListType(INT),
+        transpile_template="range({0}, {1})",
+        doc="Create a range from start to end (exclusive).",
+    ),
+})
 
 
 # =============================================================================
 # Type Constructors (Option/Result)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeConstructor:
     """
     Definition of a type constructor (Some, None, Ok, Err).
@@ -129,7 +122,7 @@ class TypeConstructor:
     doc: str
 
 
-TYPE_CONSTRUCTORS: dict[str, TypeConstructor] = {
+TYPE_CONSTRUCTORS: Mapping[str, TypeConstructor] = MappingProxyType({
     "Some": TypeConstructor(
         name="Some",
         param_count=1,
@@ -154,13 +147,16 @@ TYPE_CONSTRUCTORS: dict[str, TypeConstructor] = {
         creates_type="Result",
         doc="Create an error Result.",
     ),
-}
+})
 
 
 # =============================================================================
 # Query Functions
 # =============================================================================
 
+# Kept for compatibility; hot paths index BUILTIN_FUNCTIONS and
+# TYPE_CONSTRUCTORS directly.
+
 def is_builtin_function(name: str) -> bool:
     """Check if a name is a built-in function."""
     return name in BUILTIN_FUNCTIONS
@@ -11,15 +11,16 @@ DX Phase 1: Rich diagnostics with spans
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..ast import (
     # Expressions
     Expr, IntLiteral, FloatLiteral, StringLiteral, BoolLiteral,
     Identifier, BinaryOp, UnaryOp, Call, FieldAccess, TryExpr, ListLiteral,
     # Pattern Matching
-    MatchExpr, MatchArm, Pattern, SomePattern, NonePattern, OkPattern, ErrPattern,
+    MatchExpr, MatchArm, SomePattern, NonePattern, OkPattern, ErrPattern,
     # Type Annotations
     TypeAnnotation,
     # Statements
@@ -35,6 +36,8 @@ from .types import (
     lookup_primitive_type, lookup_parameterized_type,
 )
 
+from .builtins import BUILTIN_FUNCTIONS, TYPE_CONSTRUCTORS
+
 from ..diagnostics import (
     DiagnosticError, Span, DUMMY_SPAN,
     type_mismatch_error, undefined_variable_error, undefined_function_error,
@@ -58,11 +61,54 @@ if TYPE_CHECKING:
     pass
 
 
+# Literal node type -> its (constant) type, answered without a handler call
+_LITERAL_TYPES: dict[type, OwlType] = {
+    IntLiteral: INT,
+    FloatLiteral: FLOAT,
+    StringLiteral: STRING,
+    BoolLiteral: BOOL,
+}
+
+# Binary operator classes
+_ARITHMETIC_OPS = frozenset({'+', '-', '*', '/', '%'})
+_COMPARISON_OPS = frozenset({'==', '!=', '<', '>', '<=', '>='})
+_EQUALITY_OPS = frozenset({'==', '!='})  # the comparisons valid on any type
+
+# Constructor call -> result type built from its argument's type:
+# Some(x): Option[type(x)], Ok(x): Result[type(x), Any], Err(e): Result[Any, type(e)]
+_CONSTRUCTOR_RESULTS: dict[str, Callable[[OwlType], OwlType]] = {
+    "Some": OptionType,
+    "Ok": lambda ok_type: ResultType(ok_type, ANY),
+    "Err": lambda err_type: ResultType(ANY, err_type),
+}
+
+# Fixed generic types, built once instead of on every use
+_OPTION_ANY = OptionType(ANY)  # type of `None`
+_LIST_ANY = ListType(ANY)  # type of `[]`
+_LIST_UNKNOWN = ListType(UNKNOWN)  # list whose element type is in error
+
+# Pattern node type -> constructor name used in messages
+_PATTERN_NAMES: dict[type, str] = {
+    SomePattern: "Some",
+    NonePattern: "None",
+    OkPattern: "Ok",
+    ErrPattern: "Err",
+}
+
+# Patterns a match must cover, by subject type
+_OPTION_PATTERNS = frozenset({"Some", "None"})
+_RESULT_PATTERNS = frozenset({"Ok", "Err"})
+
+# Arm coverage is tracked as a 2-bit mask: Some/Ok -> 1, None/Err -> 2
+_PATTERN_BITS: dict[str, int] = {"Some": 1, "None": 2, "Ok": 1, "Err": 2}
+_ALL_PATTERNS_MASK = 0b11
+
+
 # =============================================================================
 # Type Errors (Legacy - kept for backward compatibility)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TypeError:
     """Represents a type error found during checking."""
     message: str
@@ -92,7 +138,7 @@ class TypeError:
 # Variable Info for tracking usage
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VarInfo:
     """Information about a variable for warning analysis."""
     name: str
@@ -111,41 +157,67 @@ class TypeEnv:
     """
     Type environment that tracks variable and function types.
     Supports nested scopes and usage tracking for warnings.
+    
+    Besides its own definitions, each scope holds a flat view of everything
+    visible from it, so lookups are a single dict probe instead of a walk
+    up the parent chain. A child shares its parent's views until it defines
+    something of its own, at which point it copies them (copy-on-write).
+    Scopes are only extended while they are the innermost one in use.
     """
     
     def __init__(self, parent: TypeEnv | None = None) -> None:
         self.parent = parent
-        self.variables: dict[str, OwlType] = {}
-        self.var_info: dict[str, VarInfo] = {}  # Extended info for warnings
+        self.var_info: dict[str, VarInfo] = {}  # Type plus usage info for warnings
         self.functions: dict[str, tuple[list[OwlType], OwlType]] = {}
+        if parent is None:
+            self._visible_vars: dict[str, VarInfo] = {}
+            self._visible_fns: dict[str, tuple[list[OwlType], OwlType]] = {}
+            self._owns_vars = self._owns_fns = True
+        else:
+            self._visible_vars = parent._visible_vars
+            self._visible_fns = parent._visible_fns
+            self._owns_vars = self._owns_fns = False
     
     def define_var(self, name: str, typ: OwlType, span: Span | None = None, is_parameter: bool = False, mutable: bool = False) -> None:
         """Define a variable in current scope."""
-        self.variables[name] = typ
-        self.var_info[name] = VarInfo(name=name, typ=typ, span=span, is_parameter=is_parameter, mutable=mutable)
+        info = VarInfo(name=name, typ=typ, span=span, is_parameter=is_parameter, mutable=mutable)
+        self.var_info[name] = info
+        if not self._owns_vars:
+            self._visible_vars = dict(self._visible_vars)
+            self._owns_vars = True
+        self._visible_vars[name] = info
     
     def lookup_var(self, name: str) -> OwlType | None:
         """Look up a variable, searching parent scopes."""
-        if name in self.variables:
-            return self.variables[name]
-        if self.parent:
-            return self.parent.lookup_var(name)
-        return None
+        # Variable lookups almost always hit, so try the subscript first:
+        # cheaper than .get() plus a None test on a hit, dearer on a miss
+        try:
+            return self._visible_vars[name].typ
+        except KeyError:
+            return None
     
     def mark_var_used(self, name: str) -> None:
         """Mark a variable as used."""
-        if name in self.var_info:
-            self.var_info[name].used = True
-        elif self.parent:
-            self.parent.mark_var_used(name)
+        try:
+            self._visible_vars[name].used = True
+        except KeyError:
+            pass
+    
+    def use_var(self, name: str) -> OwlType | None:
+        """Look up a variable and mark it as used, in a single probe."""
+        try:
+            info = self._visible_vars[name]
+        except KeyError:
+            return None
+        info.used = True
+        return info.typ
     
     def is_var_mutable(self, name: str) -> bool | None:
         """Check if a variable is mutable. Returns None if not found."""
-        if name in self.var_info:
-            return self.var_info[name].mutable
-        if self.parent:
-            return self.parent.is_var_mutable(name)
-        return None
+        try:
+            return self._visible_vars[name].mutable
+        except KeyError:
+            return None
     
     def get_unused_vars(self) -> list[VarInfo]:
         """Get all unused variables in this scope (not parent scopes)."""
@@ -157,20 +229,34 @@ class TypeEnv:
     def define_fn(self, name: str, param_types: list[OwlType], return_type: OwlType) -> None:
         """Define a function in current scope."""
         self.functions[name] = (param_types, return_type)
+        if not self._owns_fns:
+            self._visible_fns = dict(self._visible_fns)
+            self._owns_fns = True
+        self._visible_fns[name] = (param_types, return_type)
     
     def lookup_fn(self, name: str) -> tuple[list[OwlType], OwlType] | None:
         """Look up a function, searching parent scopes."""
-        if name in self.functions:
-            return self.functions[name]
-        if self.parent:
-            return self.parent.lookup_fn(name)
-        return None
+        return self._visible_fns.get(name)
     
     def child_scope(self) -> TypeEnv:
         """Create a child scope."""
         return TypeEnv(parent=self)
 
 
+def _make_builtins_env() -> TypeEnv:
+    """Build the root scope holding the built-in functions."""
+    env = TypeEnv()
+    for name, builtin in BUILTIN_FUNCTIONS.items():
+        # Convert tuple to list for define_fn
+        env.define_fn(name, list(builtin.param_types), builtin.return_type)
+    return env
+
+
+# Built once and shared by every checker. Checkers work in a child scope of
+# it, and scopes copy on write, so user definitions never reach it.
+_BUILTINS_ENV = _make_builtins_env()
+
+
 # =============================================================================
 # Type Checker
 # =============================================================================
@@ -192,8 +278,11 @@ class TypeChecker:
         self.errors: list[TypeError] = []
         self.diagnostics: list[DiagnosticError] = []
         self.warnings: list[Warning] = []
-        self.env = TypeEnv()
-        self.current_function_return_type: OwlType | None = None
+        self.env = _BUILTINS_ENV.child_scope()
+        self._current_function_return_type: OwlType | None = None
+        # Whether the current function must produce a value (return type set
+        # and not Void); kept in sync by the current_function_return_type setter
+        self._returns_value = False
         self.filename = filename
         # Track if we're inside a loop (for break/continue validation)
         self._loop_depth: int = 0
@@ -201,17 +290,40 @@ class TypeChecker:
         self._reported_errors: set[tuple[str, int, int]] = set()
         self._reported_warnings: set[tuple[str, int, int]] = set()
         
-        # Built-in functions
-        self._register_builtins()
+        # Dispatch tables: node type -> checker (one dict lookup per node)
+        self._stmt_dispatch: dict[type, Callable[[Any], None]] = {
+            LetStmt: self._check_let,
+            AssignStmt: self._check_assign,
+            ExprStmt: self._check_expr_stmt,
+            ReturnStmt: self._check_return,
+            WhileStmt: self._check_while,
+            ForInStmt: self._check_for_in,
+            LoopStmt: self._check_loop,
+            BreakStmt: self._check_break,
+            ContinueStmt: self._check_continue,
+            IfStmt: self._check_if,
+        }
+        self._expr_dispatch: dict[type, Callable[[Any], OwlType]] = {
+            Identifier: self._check_identifier,
+            BinaryOp: self._check_binary_op,
+            UnaryOp: self._check_unary_op,
+            Call: self._check_call,
+            FieldAccess: self._check_field_access,
+            TryExpr: self._check_try_expr,
+            MatchExpr: self._check_match_expr,
+            ListLiteral: self._check_list_literal,
+            IfStmt: self._check_if_expr,  # If used as expression
+        }
+    
+    @property
+    def current_function_return_type(self) -> OwlType | None:
+        """Return type of the function being checked (None outside functions)."""
+        return self._current_function_return_type
     
-    def _register_builtins(self) -> None:
-        """Register built-in functions from centralized registry."""
-        from .builtins import BUILTIN_FUNCTIONS
-        
-        for name, builtin in BUILTIN_FUNCTIONS.items():
-            # Convert tuple to list for define_fn
-            param_types = list(builtin.param_types)
-            self.env.define_fn(name, param_types, builtin.return_type)
+    @current_function_return_type.setter
+    def current_function_return_type(self, return_type: OwlType | None) -> None:
+        self._current_function_return_type = return_type
+        self._returns_value = return_type is not None and return_type is not VOID
     
     def _add_warning(self, warning: Warning) -> None:
         """Add a warning to the warning list, avoiding duplicates."""
@@ -299,18 +411,19 @@ class TypeChecker:
         """
         name = type_ann.name
         params = type_ann.params
-        span = type_ann.span if type_ann.span else DUMMY_SPAN
         
         # Explicitly reject Any - it's an internal type for Python interop only
         if name == "Any":
-            self._add_diagnostic(explicit_any_annotation_error(span))
+            self._add_diagnostic(explicit_any_annotation_error(self._get_span(type_ann)))
             return UNKNOWN
         
         # Try primitive type first (no parameters allowed)
         primitive = lookup_primitive_type(name)
         if primitive is not None:
             if params:
-                self._add_diagnostic(wrong_type_arity_error(name, 0, len(params), span))
+                self._add_diagnostic(wrong_type_arity_error(
+                    name, 0, len(params), self._get_span(type_ann)
+                ))
                 return UNKNOWN
             return primitive
         
@@ -319,25 +432,41 @@ class TypeChecker:
         if param_info is not None:
             expected_arity, constructor = param_info
             if len(params) != expected_arity:
-                self._add_diagnostic(wrong_type_arity_error(name, expected_arity, len(params), span))
+                self._add_diagnostic(wrong_type_arity_error(
+                    name, expected_arity, len(params), self._get_span(type_ann)
+                ))
                 return UNKNOWN
             # Parse inner types recursively
             parsed_params = [self._parse_type(p) for p in params]
             return constructor(parsed_params)
         
         # Unknown type
-        self._add_diagnostic(unknown_type_error(name, span))
+        self._add_diagnostic(unknown_type_error(name, self._get_span(type_ann)))
         return UNKNOWN
 
     def _stmt_has_return(self, stmt: Stmt) -> bool:
         """Check if a statement contains a return statement."""
-        if isinstance(stmt, ReturnStmt):
+        stmt_type = type(stmt)
+        if stmt_type is ReturnStmt:
             return True
-        elif isinstance(stmt, IfStmt):
-            # If/else has return if both branches have return
-            then_has_return = any(self._stmt_has_return(s) for s in stmt.then_body)
-            else_has_return = stmt.else_body and any(self._stmt_has_return(s) for s in stmt.else_body)
-            return then_has_return and else_has_return
+        if stmt_type is IfStmt:
+            # If/else has return if both branches have return; an if without
+            # else never does, so its branches are not walked at all
+            return bool(
+                stmt.else_body
+                and self._body_has_return(stmt.then_body)
+                and self._body_has_return(stmt.else_body)
+            )
+        return False
+    
+    def _body_has_return(self, body: list[Stmt]) -> bool:
+        """Check if any statement in a block returns on all paths."""
+        for stmt in body:
+            stmt_type = type(stmt)
+            if stmt_type is ReturnStmt:
+                return True
+            if stmt_type is IfStmt and self._stmt_has_return(stmt):
+                return True
         return False
     
     def _check_function(self, fn: FnDecl) -> None:
@@ -360,9 +489,8 @@ class TypeChecker:
             self.current_function_return_type = fn_info[1]
         
         # Check for empty body with non-void return type
-        if (self.current_function_return_type and 
-            self.current_function_return_type != VOID and
-            not fn.body):
+        body = fn.body
+        if self._returns_value and not body:
             span = self._get_span(fn)
             self._add_diagnostic(return_type_mismatch_error(
                 str(self.current_function_return_type), "Void (empty body)", span
@@ -373,43 +501,34 @@ class TypeChecker:
         
         # Check body statements
         last_stmt_type: OwlType = VOID
+        last_index = len(body) - 1
+        # Set once a statement returns on all paths; everything after it is
+        # unreachable and the implicit-return check no longer applies
         has_explicit_return = False
-        found_return_at: int | None = None  # Track position of first return
-        is_last_stmt = lambda idx: idx == len(fn.body) - 1
         
-        for i, stmt in enumerate(fn.body):
+        for i, stmt in enumerate(body):
             # Check for unreachable code (code after return)
-            if found_return_at is not None:
-                self._add_warning(unreachable_code_warning(
-                    getattr(stmt, 'span', None)
-                ))
+            if has_explicit_return:
+                self._add_warning(unreachable_code_warning(stmt.span))
             
-            if isinstance(stmt, ExprStmt):
+            stmt_type = type(stmt)
+            if stmt_type is ExprStmt:
                 # Track the type of the last expression (for implicit return)
                 last_stmt_type = self._check_expr(stmt.expr)
                 # Warn if Result or Option value is ignored
                 # But NOT if this is the last statement used as implicit return
-                is_implicit_return = (
-                    is_last_stmt(i) and 
-                    self.current_function_return_type and 
-                    self.current_function_return_type != VOID
-                )
-                if not is_implicit_return:
+                if i != last_index or not self._returns_value:
                     self._check_ignored_value(last_stmt_type, stmt.expr)
-            elif isinstance(stmt, ReturnStmt):
-                self._check_stmt(stmt)
+            elif stmt_type is ReturnStmt:
+                self._check_return(stmt)
                 has_explicit_return = True
                 last_stmt_type = VOID
-                if found_return_at is None:
-                    found_return_at = i
-            elif isinstance(stmt, IfStmt):
+            elif stmt_type is IfStmt:
                 # Check if as expression and track type for implicit return
                 last_stmt_type = self._check_if_expr(stmt)
                 # Also check if it has explicit returns in all branches
-                if self._stmt_has_return(stmt):
+                if not has_explicit_return and self._stmt_has_return(stmt):
                     has_explicit_return = True
-                    if found_return_at is None:
-                        found_return_at = i
             else:
                 self._check_stmt(stmt)
                 last_stmt_type = VOID
@@ -420,54 +539,34 @@ class TypeChecker:
             self.current_function_return_type = None
             return
         
-        # Check implicit return (last expression as return value)
-        if (self.current_function_return_type and 
-            self.current_function_return_type != VOID):
+        # Check implicit return (last expression as return value); an empty
+        # body was already reported above
+        if self._returns_value:
+            last_stmt = body[-1]
+            last_stmt_span = self._get_span(last_stmt)
             
-            if not fn.body:
-                # Already handled above
-                pass
-            else:
-                last_stmt = fn.body[-1]
-                last_stmt_span = self._get_span(last_stmt)
-                
-                # Check if last statement can be an implicit return
-                if isinstance(last_stmt, ExprStmt):
-                    last_expr = last_stmt.expr
-                    # Check if it's an if without else (not exhaustive)
-                    if isinstance(last_expr, IfStmt) and not last_expr.else_body:
-                        self._add_diagnostic(return_type_mismatch_error(
-                            f"{self.current_function_return_type} on all paths",
-                            "if without else branch",
-                            last_stmt_span
-                        ))
-                    elif not types_compatible(self.current_function_return_type, last_stmt_type):
-                        self._add_diagnostic(return_type_mismatch_error(
-                            str(self.current_function_return_type),
-                            str(last_stmt_type),
-                            last_stmt_span
-                        ))
-                elif isinstance(last_stmt, IfStmt):
-                    # IfStmt directly in body - check exhaustiveness
-                    if not last_stmt.else_body:
-                        self._add_diagnostic(return_type_mismatch_error(
-                            f"{self.current_function_return_type} on all paths",
-                            "if without else branch",
-                            last_stmt_span
-                        ))
-                    elif not types_compatible(self.current_function_return_type, last_stmt_type):
-                        self._add_diagnostic(return_type_mismatch_error(
-                            str(self.current_function_return_type),
-                            str(last_stmt_type),
-                            last_stmt_span
-                        ))
-                else:
-                    # Last statement is not an expression (e.g., let statement)
-                    self._add_diagnostic(return_type_mismatch_error(
-                        str(self.current_function_return_type),
-                        "non-expression statement",
-                        last_stmt_span
-                    ))
+            # The value is the last statement: an expression, possibly an if
+            tail = last_stmt.expr if type(last_stmt) is ExprStmt else last_stmt
+            if type(tail) is IfStmt and not tail.else_body:
+                # If without else is not exhaustive
+                self._add_diagnostic(return_type_mismatch_error(
+                    f"{self.current_function_return_type} on all paths",
+                    "if without else branch",
+                    last_stmt_span
+                ))
+            elif type(last_stmt) is not ExprStmt and type(last_stmt) is not IfStmt:
+                # Last statement is not an expression (e.g., let statement)
+                self._add_diagnostic(return_type_mismatch_error(
+                    str(self.current_function_return_type),
+                    "non-expression statement",
+                    last_stmt_span
+                ))
+            elif not types_compatible(self.current_function_return_type, last_stmt_type):
+                self._add_diagnostic(return_type_mismatch_error(
+                    str(self.current_function_return_type),
+                    str(last_stmt_type),
+                    last_stmt_span
+                ))
         
         # Generate warnings for unused variables and parameters
         for var_info in self.env.get_unused_vars():
@@ -486,45 +585,30 @@ class TypeChecker:
     
     def _check_stmt(self, stmt: Stmt) -> None:
         """Check a statement for type errors."""
-        if isinstance(stmt, LetStmt):
-            self._check_let(stmt)
-        elif isinstance(stmt, AssignStmt):
-            self._check_assign(stmt)
-        elif isinstance(stmt, ExprStmt):
-            self._check_expr(stmt.expr)
-            # Note: _check_ignored_value is called in _check_function loop
-            # to avoid warning for implicit returns
-        elif isinstance(stmt, ReturnStmt):
-            self._check_return(stmt)
-        elif isinstance(stmt, WhileStmt):
-            self._check_while(stmt)
-        elif isinstance(stmt, ForInStmt):
-            self._check_for_in(stmt)
-        elif isinstance(stmt, LoopStmt):
-            self._check_loop(stmt)
-        elif isinstance(stmt, BreakStmt):
-            self._check_break(stmt)
-        elif isinstance(stmt, ContinueStmt):
-            self._check_continue(stmt)
-        elif isinstance(stmt, IfStmt):
-            self._check_if(stmt)
+        handler = self._stmt_dispatch.get(type(stmt))
+        if handler is not None:
+            handler(stmt)
+    
+    def _check_expr_stmt(self, stmt: ExprStmt) -> None:
+        """Check an expression statement."""
+        self._check_expr(stmt.expr)
+        # Note: _check_ignored_value is called in _check_function loop
+        # to avoid warning for implicit returns
     
     def _check_ignored_value(self, expr_type: OwlType, expr: Expr) -> None:
         """Check if a Result or Option value is being ignored and warn."""
-        span = self._get_expr_span(expr)
-        if isinstance(expr_type, ResultType):
-            self.warnings.append(result_ignored_warning(span))
-        elif isinstance(expr_type, OptionType):
-            self.warnings.append(option_ignored_warning(span))
+        value_class = type(expr_type)
+        if value_class is ResultType:
+            self.warnings.append(result_ignored_warning(self._get_expr_span(expr)))
+        elif value_class is OptionType:
+            self.warnings.append(option_ignored_warning(self._get_expr_span(expr)))
     
     def _get_expr_span(self, expr: Expr) -> Span:
         """Get span for an expression, falling back to DUMMY_SPAN if not available."""
-        # First try to get the span directly from the expression (new style)
-        span = getattr(expr, 'span', None)
-        if span is not None:
-            return span
-        # Legacy fallback for expressions without spans
-        return DUMMY_SPAN
+        # Every concrete AST node has a span field; it is None for nodes
+        # built without position info (e.g. in tests)
+        span = expr.span
+        return span if span is not None else DUMMY_SPAN
     
     def _check_let(self, stmt: LetStmt) -> None:
         """Check let statement."""
@@ -676,7 +760,7 @@ class TypeChecker:
         if stmt.value:
             return_type = self._check_expr(stmt.value)
             
-            if self.current_function_return_type and self.current_function_return_type != VOID:
+            if self._returns_value:
                 if not types_compatible(self.current_function_return_type, return_type):
                     span = self._get_span(stmt)
                     self._add_diagnostic(return_type_mismatch_error(
@@ -717,128 +801,112 @@ class TypeChecker:
         Check if/else as an expression and return its type.
         Both branches must have compatible types.
         If no else, returns Void.
-        """
-        cond_type = self._check_expr(stmt.condition)
         
-        # Check for constant condition (if true / if false)
-        self._check_constant_condition(stmt.condition)
-        
-        # Condition should be Bool
-        if cond_type not in (BOOL, ANY, UNKNOWN):
-            span = self._get_expr_span(stmt.condition)
-            self._add_diagnostic(condition_not_bool_error(str(cond_type), span))
-        
-        # Get type of last expression in then branch
-        then_type = VOID
-        if stmt.then_body:
-            last_then = stmt.then_body[-1]
-            if isinstance(last_then, ExprStmt):
-                then_type = self._check_expr(last_then.expr)
-            elif isinstance(last_then, IfStmt):
-                # Nested if/else - recursively check as expression
-                then_type = self._check_if_expr(last_then)
-            else:
-                self._check_stmt(last_then)
-                then_type = VOID
-            # Check other statements in then branch
-            for s in stmt.then_body[:-1]:
+        Else-if ladders (an else branch ending in another if) are walked in a
+        loop; the branch compatibility checks then run innermost-first, as the
+        recursive form did.
+        """
+        pending: list[tuple[IfStmt, OwlType]] = []
+        while True:
+            cond_type = self._check_expr(stmt.condition)
+            
+            # Check for constant condition (if true / if false)
+            self._check_constant_condition(stmt.condition)
+            
+            # Condition should be Bool
+            if cond_type not in (BOOL, ANY, UNKNOWN):
+                span = self._get_expr_span(stmt.condition)
+                self._add_diagnostic(condition_not_bool_error(str(cond_type), span))
+            
+            # Get type of last expression in then branch
+            then_type = self._check_branch_body(stmt.then_body)
+            
+            # If no else branch, type is Void
+            else_body = stmt.else_body
+            if not else_body:
+                result = VOID
+                break
+            
+            pending.append((stmt, then_type))
+            tail = else_body[-1]
+            if type(tail) is not IfStmt:
+                result = self._check_branch_body(else_body)
+                break
+            for s in else_body[:-1]:
                 self._check_stmt(s)
+            stmt = tail
         
-        # If no else branch, type is Void
-        if not stmt.else_body:
-            return VOID
-        
-        # Get type of last expression in else branch
-        else_type = VOID
-        if stmt.else_body:
-            last_else = stmt.else_body[-1]
-            if isinstance(last_else, ExprStmt):
-                else_type = self._check_expr(last_else.expr)
-            elif isinstance(last_else, IfStmt):
-                # Nested if/else - recursively check as expression
-                else_type = self._check_if_expr(last_else)
+        for stmt, then_type in reversed(pending):
+            else_type = result
+            
+            # Both branches must have compatible types
+            if not types_compatible(then_type, else_type):
+                span = self._get_span(stmt)
+                self._add_diagnostic(type_mismatch_error(
+                    f"then: {then_type}", f"else: {else_type}", span,
+                    hint="both branches of an if expression must return compatible types"
+                ))
+            
+            # Keep the more specific type
+            if then_type != ANY:
+                result = then_type
+        return result
+    
+    def _check_branch_body(self, body: list[Stmt]) -> OwlType:
+        """
+        Check an if/else branch in source order and return its value type:
+        the type of its last statement if that is an expression (or a nested
+        if/else), otherwise Void.
+        """
+        last = len(body) - 1
+        for i, s in enumerate(body):
+            if i != last:
+                self._check_stmt(s)
+            elif type(s) is ExprStmt:
+                return self._check_expr(s.expr)
+            elif type(s) is IfStmt:
+                # Nested if/else - check as expression
+                return self._check_if_expr(s)
             else:
-                self._check_stmt(last_else)
-                else_type = VOID
-            # Check other statements in else branch
-            for s in stmt.else_body[:-1]:
                 self._check_stmt(s)
-        
-        # Both branches must have compatible types
-        if not types_compatible(then_type, else_type):
-            span = self._get_span(stmt)
-            self._add_diagnostic(type_mismatch_error(
-                f"then: {then_type}", f"else: {else_type}", span,
-                hint="both branches of an if expression must return compatible types"
-            ))
-        
-        # Return the more specific type
-        if then_type == ANY:
-            return else_type
-        return then_type
+        return VOID
     
     def _check_expr(self, expr: Expr) -> OwlType:
         """Check an expression and return its type."""
-        if isinstance(expr, IntLiteral):
-            return INT
-        
-        elif isinstance(expr, FloatLiteral):
-            return FLOAT
-        
-        elif isinstance(expr, StringLiteral):
-            return STRING
-        
-        elif isinstance(expr, BoolLiteral):
-            return BOOL
-        
-        elif isinstance(expr, Identifier):
-            # Special case: None is Option[Any]
-            if expr.name == "None":
-                return OptionType(ANY)
-            
-            typ = self.env.lookup_var(expr.name)
-            if typ is None:
-                span = self._get_expr_span(expr)
-                self._add_diagnostic(undefined_variable_error(expr.name, span))
-                return UNKNOWN
-            # Mark variable as used for unused variable warnings
-            self.env.mark_var_used(expr.name)
-            return typ
-        
-        elif isinstance(expr, BinaryOp):
-            return self._check_binary_op(expr)
-        
-        elif isinstance(expr, UnaryOp):
-            return self._check_unary_op(expr)
-        
-        elif isinstance(expr, Call):
-            return self._check_call(expr)
-        
-        elif isinstance(expr, FieldAccess):
-            # For now, field access on ANY returns ANY
-            self._check_expr(expr.object)
-            return ANY
-        
-        elif isinstance(expr, TryExpr):
-            return self._check_try_expr(expr)
-        
-        elif isinstance(expr, MatchExpr):
-            return self._check_match_expr(expr)
-        
-        elif isinstance(expr, ListLiteral):
-            return self._check_list_literal(expr)
-        
-        elif isinstance(expr, IfStmt):
-            # If used as expression
-            return self._check_if_expr(expr)
-        
-        return UNKNOWN
+        expr_type = type(expr)
+        literal_type = _LITERAL_TYPES.get(expr_type)
+        if literal_type is not None:
+            return literal_type
+        handler = self._expr_dispatch.get(expr_type)
+        if handler is None:
+            return UNKNOWN
+        return handler(expr)
+    
+    def _check_identifier(self, expr: Identifier) -> OwlType:
+        """Check a variable reference and mark it as used."""
+        # Special case: None is Option[Any]
+        if expr.name == "None":
+            return _OPTION_ANY
+        
+        # Resolve and mark as used (for unused variable warnings) together
+        typ = self.env.use_var(expr.name)
+        if typ is None:
+            span = self._get_expr_span(expr)
+            self._add_diagnostic(undefined_variable_error(expr.name, span))
+            return UNKNOWN
+        return typ
+    
+    def _check_field_access(self, expr: FieldAccess) -> OwlType:
+        """Check field access."""
+        # For now, field access on ANY returns ANY
+        self._check_expr(expr.object)
+        return ANY
     
     def _check_list_literal(self, expr: ListLiteral) -> OwlType:
         """Check list literal and return its type."""
         if not expr.elements:
             # Empty list - type will be determined by context
-            return ListType(ANY)
+            return _LIST_ANY
         
         # Check all elements and determine common type
         element_types: list[OwlType] = []
@@ -856,7 +924,7 @@ class TypeChecker:
                     str(elem_type),
                     span
                 ))
-                return ListType(UNKNOWN)
+                return _LIST_UNKNOWN
         
         return ListType(first_type)
     
@@ -866,20 +934,23 @@ class TypeChecker:
         right_type = self._check_expr(expr.right)
         op = expr.operator
         
+        # Primitive types are singletons, so the scalar rules below compare
+        # by identity instead of going through OwlType.__eq__
+        
         # Handle ANY type (from Python imports)
-        if left_type == ANY or right_type == ANY:
+        if left_type is ANY or right_type is ANY:
             return ANY
         
         # Arithmetic operators: + - * / %
-        if op in ('+', '-', '*', '/', '%'):
+        if op in _ARITHMETIC_OPS:
             # String concatenation
-            if op == '+' and left_type == STRING and right_type == STRING:
+            if op == '+' and left_type is STRING and right_type is STRING:
                 return STRING
             
             # Numeric operations
-            if left_type in (INT, FLOAT) and right_type in (INT, FLOAT):
+            if (left_type is INT or left_type is FLOAT) and (right_type is INT or right_type is FLOAT):
                 # Float if either operand is Float
-                if left_type == FLOAT or right_type == FLOAT:
+                if left_type is FLOAT or right_type is FLOAT:
                     return FLOAT
                 return INT
             
@@ -889,9 +960,9 @@ class TypeChecker:
             return UNKNOWN
         
         # Comparison operators: == != < > <= >=
-        if op in ('==', '!=', '<', '>', '<=', '>='):
+        if op in _COMPARISON_OPS:
             # Equality works on same types
-            if op in ('==', '!='):
+            if op in _EQUALITY_OPS:
                 if left_type == right_type:
                     return BOOL
                 span = self._get_expr_span(expr)
@@ -901,7 +972,7 @@ class TypeChecker:
                 return BOOL
             
             # Ordering only for numeric types
-            if left_type in (INT, FLOAT) and right_type in (INT, FLOAT):
+            if (left_type is INT or left_type is FLOAT) and (right_type is INT or right_type is FLOAT):
                 return BOOL
             
             span = self._get_expr_span(expr)
@@ -918,7 +989,7 @@ class TypeChecker:
         op = expr.operator
         
         if op == '-':
-            if operand_type in (INT, FLOAT, ANY):
+            if operand_type is INT or operand_type is FLOAT or operand_type is ANY:
                 return operand_type
             span = self._get_expr_span(expr)
             self._add_diagnostic(invalid_operation_error(op, str(operand_type), "", span))
@@ -927,19 +998,17 @@ class TypeChecker:
     
     def _check_call(self, expr: Call) -> OwlType:
         """Check function call."""
-        from .builtins import is_type_constructor, get_builtin
-        
         # Get callee type
         if isinstance(expr.callee, Identifier):
             callee_name = expr.callee.name
             
             # Check for type constructors: Some, Ok, Err
-            if is_type_constructor(callee_name):
+            if callee_name in TYPE_CONSTRUCTORS:
                 return self._check_type_constructor_call(callee_name, expr)
             
             # Check for built-ins with generic return types (special handling)
-            builtin = get_builtin(callee_name)
-            if builtin and builtin.generic_return:
+            builtin = BUILTIN_FUNCTIONS.get(callee_name)
+            if builtin is not None and builtin.generic_return:
                 if callee_name == "get":
                     return self._check_get_call(expr)
                 elif callee_name == "push":
@@ -989,57 +1058,27 @@ class TypeChecker:
     
     def _check_type_constructor_call(self, name: str, expr: Call) -> OwlType:
         """
-        Check a type constructor call (Some, Ok, Err).
+        Check a type constructor call: Some(x), Ok(x) or Err(e).
         
-        Uses the TYPE_CONSTRUCTORS registry to dispatch to appropriate handler.
+        Each takes exactly one argument; the result type wraps its type
+        (see _CONSTRUCTOR_RESULTS). With the wrong argument count the
+        constructor is applied to Any.
         """
-        if name == "Some":
-            return self._check_some_call(expr)
-        elif name == "Ok":
-            return self._check_ok_call(expr)
-        elif name == "Err":
-            return self._check_err_call(expr)
-        else:
-            # This shouldn't happen if is_type_constructor works correctly
+        make_type = _CONSTRUCTOR_RESULTS.get(name)
+        if make_type is None:
+            # None takes no arguments, so None(...) is not a valid call
             span = self._get_expr_span(expr)
             self._add_diagnostic(undefined_function_error(name, span))
             return UNKNOWN
-    
-    def _check_some_call(self, expr: Call) -> OwlType:
-        """Check Some(x) constructor - returns Option[type(x)]."""
-        if len(expr.arguments) != 1:
-            span = self._get_expr_span(expr)
-            self._add_diagnostic(wrong_arg_count_error(
-                "Some", 1, len(expr.arguments), span
-            ))
-            return OptionType(ANY)
-        
-        inner_type = self._check_expr(expr.arguments[0])
-        return OptionType(inner_type)
-    
-    def _check_ok_call(self, expr: Call) -> OwlType:
-        """Check Ok(x) constructor - returns Result[type(x), Any]."""
-        if len(expr.arguments) != 1:
-            span = self._get_expr_span(expr)
-            self._add_diagnostic(wrong_arg_count_error(
-                "Ok", 1, len(expr.arguments), span
-            ))
-            return ResultType(ANY, ANY)
         
-        ok_type = self._check_expr(expr.arguments[0])
-        return ResultType(ok_type, ANY)
-    
-    def _check_err_call(self, expr: Call) -> OwlType:
-        """Check Err(e) constructor - returns Result[Any, type(e)]."""
         if len(expr.arguments) != 1:
             span = self._get_expr_span(expr)
             self._add_diagnostic(wrong_arg_count_error(
-                "Err", 1, len(expr.arguments), span
+                name, 1, len(expr.arguments), span
             ))
-            return ResultType(ANY, ANY)
+            return make_type(ANY)
         
-        err_type = self._check_expr(expr.arguments[0])
-        return ResultType(ANY, err_type)
+        return make_type(self._check_expr(expr.arguments[0]))
     
     def _check_get_call(self, expr: Call) -> OwlType:
         """Check get(list, index) - returns the element type T from List[T]."""
@@ -1071,7 +1110,7 @@ class TypeChecker:
         if len(expr.arguments) != 2:
             span = self._get_span(expr)
             self._add_diagnostic(wrong_arg_count_error("push", 2, len(expr.arguments), span))
-            return ListType(UNKNOWN)
+            return _LIST_UNKNOWN
         
         list_type = self._check_expr(expr.arguments[0])
         value_type = self._check_expr(expr.arguments[1])
@@ -1092,7 +1131,7 @@ class TypeChecker:
         else:
             span = self._get_span(expr.arguments[0])
             self._add_diagnostic(type_mismatch_error("List[T]", str(list_type), span))
-            return ListType(UNKNOWN)
+            return _LIST_UNKNOWN
     
     def _check_try_expr(self, expr: TryExpr) -> OwlType:
         """
@@ -1108,7 +1147,7 @@ class TypeChecker:
         span = self._get_span(expr)
         
         # Rule 1: operand must be Result[T, E]
-        if not isinstance(operand_type, ResultType):
+        if type(operand_type) is not ResultType:
             self._add_diagnostic(try_not_result_error(str(operand_type), span))
             return UNKNOWN
         
@@ -1117,7 +1156,7 @@ class TypeChecker:
             self._add_diagnostic(try_outside_result_fn_error(span))
             return operand_type.ok_type
         
-        if not isinstance(self.current_function_return_type, ResultType):
+        if type(self.current_function_return_type) is not ResultType:
             self._add_diagnostic(try_outside_result_fn_error(span))
             return operand_type.ok_type
         
@@ -1151,32 +1190,32 @@ class TypeChecker:
         subject_type = self._check_expr(expr.subject)
         span = self._get_span(expr)
         
-        # Rule 1: subject must be Option or Result
-        if not isinstance(subject_type, (OptionType, ResultType)):
+        # Rule 1: subject must be Option or Result. Determine the expected
+        # patterns and what each binding pattern binds
+        binding_types: dict[type, OwlType]
+        subject_class = type(subject_type)
+        if subject_class is OptionType:
+            expected_patterns = _OPTION_PATTERNS
+            binding_types = {SomePattern: subject_type.inner}
+        elif subject_class is ResultType:
+            expected_patterns = _RESULT_PATTERNS
+            binding_types = {OkPattern: subject_type.ok_type, ErrPattern: subject_type.err_type}
+        else:
             self._error(
                 f"match requires Option or Result type, got {subject_type}",
                 span.start.line, span.start.column
             )
             return UNKNOWN
         
-        # Determine expected patterns
-        if isinstance(subject_type, OptionType):
-            expected_patterns = {"Some", "None"}
-            inner_type = subject_type.inner
-        else:  # ResultType
-            expected_patterns = {"Ok", "Err"}
-            ok_type = subject_type.ok_type
-            err_type = subject_type.err_type
-        
         # Track found patterns for exhaustivity check
-        found_patterns: set[str] = set()
+        found_mask = 0
         arm_types: list[OwlType] = []
         
         for arm in expr.arms:
             pattern = arm.pattern
             
             # Rule 2: validate pattern matches subject type
-            pattern_name = self._get_pattern_name(pattern)
+            pattern_name = _PATTERN_NAMES.get(type(pattern), "Unknown")
             pattern_span = self._get_span(pattern)
             
             if pattern_name not in expected_patterns:
@@ -1188,21 +1227,16 @@ class TypeChecker:
                 ))
                 continue
             
-            found_patterns.add(pattern_name)
+            found_mask |= _PATTERN_BITS[pattern_name]
             
             # Rule 5: introduce binding in arm scope
             arm_env = self.env.child_scope()
             old_env = self.env
             self.env = arm_env
             
-            if isinstance(subject_type, OptionType):
-                if isinstance(pattern, SomePattern):
-                    self.env.define_var(pattern.binding, inner_type)
-            else:  # ResultType
-                if isinstance(pattern, OkPattern):
-                    self.env.define_var(pattern.binding, ok_type)
-                elif isinstance(pattern, ErrPattern):
-                    self.env.define_var(pattern.binding, err_type)
+            binding_type = binding_types.get(type(pattern))
+            if binding_type is not None:
+                self.env.define_var(pattern.binding, binding_type)
             
             # Type check the arm body
             body_type = self._check_expr(arm.body)
@@ -1212,8 +1246,11 @@ class TypeChecker:
             self.env = old_env
         
         # Rule 3: check exhaustivity
-        missing_patterns = expected_patterns - found_patterns
-        if missing_patterns:
+        if found_mask != _ALL_PATTERNS_MASK:
+            missing_patterns = {
+                name for name in expected_patterns
+                if not found_mask & _PATTERN_BITS[name]
+            }
             self._add_diagnostic(match_not_exhaustive_error(missing_patterns, span))
         
         # Rule 4: check all arm types are compatible
@@ -1234,26 +1271,12 @@ class TypeChecker:
         
         return result_type
     
-    def _get_pattern_name(self, pattern: Pattern) -> str:
-        """Get the name of a pattern for error messages."""
-        if isinstance(pattern, SomePattern):
-            return "Some"
-        elif isinstance(pattern, NonePattern):
-            return "None"
-        elif isinstance(pattern, OkPattern):
-            return "Ok"
-        elif isinstance(pattern, ErrPattern):
-            return "Err"
-        return "Unknown"
-    
-    def _get_span(self, node: Expr | Stmt | None) -> Span:
+    def _get_span(self, node: Expr | Stmt | TypeAnnotation | None) -> Span:
         """Get span from a node, returning DUMMY_SPAN if not available."""
         if node is None:
             return DUMMY_SPAN
-        span = getattr(node, 'span', None)
-        if span is not None:
-            return span
-        return DUMMY_SPAN
+        span = node.span
+        return span if span is not None else DUMMY_SPAN
     
     def _error(self, message: str, line: int, column: int) -> None:
         """Record a type error (legacy method for backward compatibility)."""
@@ -76,6 +76,12 @@ _TYPE_ALIASES: dict[str, str] = {
     "void": "Void",
 }
 
+# Canonical names and aliases folded into one table, built once at import
+_PRIMITIVE_LOOKUP: dict[str, OwlType] = {
+    **PRIMITIVE_TYPES,
+    **{alias: PRIMITIVE_TYPES[canonical] for alias, canonical in _TYPE_ALIASES.items()},
+}
+
 
 def lookup_primitive_type(name: str) -> OwlType | None:
     """
@@ -84,14 +90,7 @@ def lookup_primitive_type(name: str) -> OwlType | None:
     Supports canonical names (Int, Float, etc.) and aliases (int, str, etc.).
     Returns None if the type is not a known primitive.
     """
-    # Try canonical name first
-    if name in PRIMITIVE_TYPES:
-        return PRIMITIVE_TYPES[name]
-    # Try alias
-    canonical = _TYPE_ALIASES.get(name)
-    if canonical:
-        return PRIMITIVE_TYPES[canonical]
-    return None
+    return _PRIMITIVE_LOOKUP.get(name)
 
 
 # =============================================================================
@@ -113,16 +112,14 @@ class OptionType(OwlType):
         object.__setattr__(self, 'name', f"Option[{inner}]")
         object.__setattr__(self, 'inner', inner)
     
-    def __str__(self) -> str:
-        return f"Option[{self.inner}]"
-    
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, OptionType):
-            # Option[Any] is compatible with any Option[T]
-            if self.inner == ANY or other.inner == ANY:
-                return True
-            return self.inner == other.inner
-        return False
+        if self is other:
+            return True
+        if type(other) is not OptionType:
+            return False
+        # Option[Any] is compatible with any Option[T]
+        a, b = self.inner, other.inner
+        return a is b or a is ANY or b is ANY or a == b
     
     def __hash__(self) -> int:
         return hash(("Option", self.inner))
@@ -144,25 +141,19 @@ class ResultType(OwlType):
         object.__setattr__(self, 'ok_type', ok_type)
         object.__setattr__(self, 'err_type', err_type)
     
-    def __str__(self) -> str:
-        return f"Result[{self.ok_type}, {self.err_type}]"
-    
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, ResultType):
-            # Check ok_type compatibility (ANY matches anything)
-            ok_match = (
-                self.ok_type == ANY or 
-                other.ok_type == ANY or 
-                self.ok_type == other.ok_type
-            )
-            # Check err_type compatibility
-            err_match = (
-                self.err_type == ANY or 
-                other.err_type == ANY or 
-                self.err_type == other.err_type
-            )
-            return ok_match and err_match
-        return False
+        if self is other:
+            return True
+        if type(other) is not ResultType:
+            return False
+        # Check ok_type compatibility (ANY matches anything), stopping at
+        # the first mismatch
+        a, b = self.ok_type, other.ok_type
+        if not (a is b or a is ANY or b is ANY or a == b):
+            return False
+        # Check err_type compatibility
+        a, b = self.err_type, other.err_type
+        return a is b or a is ANY or b is ANY or a == b
     
     def __hash__(self) -> int:
         return hash(("Result", self.ok_type, self.err_type))
@@ -183,16 +174,14 @@ class ListType(OwlType):
         object.__setattr__(self, 'name', f"List[{element_type}]")
         object.__setattr__(self, 'element_type', element_type)
     
-    def __str__(self) -> str:
-        return f"List[{self.element_type}]"
-    
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, ListType):
-            # List[Any] is compatible with any List[T]
-            if self.element_type == ANY or other.element_type == ANY:
-                return True
-            return self.element_type == other.element_type
-        return False
+        if self is other:
+            return True
+        if type(other) is not ListType:
+            return False
+        # List[Any] is compatible with any List[T]
+        a, b = self.element_type, other.element_type
+        return a is b or a is ANY or b is ANY or a == b
     
     def __hash__(self) -> int:
         return hash(("List", self.element_type))
@@ -202,6 +191,10 @@ class ListType(OwlType):
 # Type Utilities
 # =============================================================================
 
+# Primitive names accepted by parse_type(); unlike annotations, Any is allowed
+_PARSE_TYPE_PRIMITIVES: dict[str, OwlType] = {**_PRIMITIVE_LOOKUP, "Any": ANY}
+
+
 def parse_type(type_str: str) -> OwlType:
     """
     Parse a type annotation string into an OwlType.
@@ -214,17 +207,9 @@ def parse_type(type_str: str) -> OwlType:
     type_str = type_str.strip()
     
     # Primitive types
-    primitives = {
-        "int": INT, "Int": INT,
-        "float": FLOAT, "Float": FLOAT,
-        "str": STRING, "String": STRING,
-        "bool": BOOL, "Bool": BOOL,
-        "void": VOID, "Void": VOID,
-        "Any": ANY,
-    }
-    
-    if type_str in primitives:
-        return primitives[type_str]
+    primitive = _PARSE_TYPE_PRIMITIVES.get(type_str)
+    if primitive is not None:
+        return primitive
     
     # Option[T]
     if type_str.startswith("Option[") and type_str.endswith("]"):
@@ -277,25 +262,18 @@ def types_compatible(expected: OwlType, actual: OwlType) -> bool:
     - List[T] == List[T] or List[Any]
     - Primitive types must match exactly
     """
-    # ANY and UNKNOWN are wildcards
-    if expected == ANY or actual == ANY:
-        return True
-    if expected == UNKNOWN or actual == UNKNOWN:
+    # Identical types are trivially compatible
+    if expected is actual:
         return True
     
-    # Both Option types
-    if isinstance(expected, OptionType) and isinstance(actual, OptionType):
-        return expected == actual  # __eq__ handles ANY
-    
-    # Both Result types
-    if isinstance(expected, ResultType) and isinstance(actual, ResultType):
-        return expected == actual  # __eq__ handles ANY
-    
-    # Both List types
-    if isinstance(expected, ListType) and isinstance(actual, ListType):
-        return expected == actual  # __eq__ handles ANY
+    # ANY and UNKNOWN are wildcards (singletons, so compare by identity)
+    if expected is ANY or actual is ANY:
+        return True
+    if expected is UNKNOWN or actual is UNKNOWN:
+        return True
     
-    # Same type class
+    # Option, Result and List __eq__ handle ANY inside type parameters;
+    # primitive types must match exactly
     return expected == actual
 
 
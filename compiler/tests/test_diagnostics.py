@@ -112,6 +112,28 @@ class TestSpan:
         assert merged.start.column == 5
         assert merged.end.column == 19
     
+    def test_span_merge_across_lines(self) -> None:
+        """Merge orders positions by line before column."""
+        span1 = Span.from_positions(2, 1, 2, 4)
+        span2 = Span.from_positions(1, 30, 1, 40)
+        merged = span1.merge(span2)
+        assert (merged.start.line, merged.start.column) == (1, 30)
+        assert (merged.end.line, merged.end.column) == (2, 4)
+    
+    def test_span_merge_contained_returns_self(self) -> None:
+        """Merging a contained span reuses the outer span."""
+        outer = Span.from_positions(1, 1, 3, 10)
+        inner = Span.single(2, 5, 3)
+        assert outer.merge(inner) is outer
+    
+    def test_token_span(self) -> None:
+        """Token.span covers the token's text in the given file."""
+        from owllang import Token, TokenType
+        token = Token(TokenType.IDENT, "abc", 2, 5)
+        span = token.span("a.ow")
+        assert (span.start.line, span.start.column, span.end.column) == (2, 5, 7)
+        assert span.filename == "a.ow"
+    
     def test_span_is_multiline(self) -> None:
         """Check if span is multiline."""
         single = Span.single(1, 5, 3)
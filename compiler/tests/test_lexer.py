@@ -36,6 +36,11 @@ class TestTokenTypes:
         assert tokens[0].type == TokenType.STRING
         assert tokens[0].value == "Hello\nWorld"
     
+    def test_string_unknown_escape_keeps_char(self) -> None:
+        """Unknown escapes resolve to the escaped character, including non-ASCII."""
+        tokens = tokenize(r'"a\tb\"c\qé\€"')
+        assert tokens[0].value == 'a\tb"cqé€'
+    
     def test_boolean_true(self) -> None:
         """Lexer recognizes true keyword."""
         tokens = tokenize("true")
@@ -197,6 +202,13 @@ fn main() { }"""
         # The 42 should be on line 5
         assert tokens[0].type == TokenType.INT
         assert tokens[0].line == 5
+    
+    def test_multiline_comment_column_tracking(self) -> None:
+        """Columns after a closing */ account for the text on its line."""
+        tokens = tokenize("/** a */ x\n/**\n  b */ y")
+        
+        assert (tokens[0].line, tokens[0].column) == (1, 10)  # x
+        assert (tokens[1].line, tokens[1].column) == (3, 8)   # y
 
 
 class TestComplexTokenization:
@@ -258,6 +270,14 @@ class TestPositionTracking:
         assert tokens[1].column == 5   # x
         assert tokens[2].column == 7   # =
         assert tokens[3].column == 9   # 42
+    
+    def test_positions_after_whitespace_and_comments(self) -> None:
+        """Columns stay correct after indentation runs and line comments."""
+        tokens = tokenize("\t  let x = 1 // trailing\n    y")
+        
+        assert (tokens[0].line, tokens[0].column) == (1, 4)   # let
+        assert (tokens[4].line, tokens[4].column) == (2, 5)   # y
+        assert (tokens[5].line, tokens[5].column) == (2, 6)   # EOF
 
 
 class TestErrors:
@@ -309,3 +329,19 @@ class TestLexerClass:
         for t1, t2 in zip(tokens1, tokens2):
             assert t1.type == t2.type
             assert t1.value == t2.value
+    
+    def test_tokenize_returns_list(self) -> None:
+        """tokenize() returns a plain list of Token objects, EOF last."""
+        tokens = tokenize("let x = 1")
+        
+        assert type(tokens) is list
+        assert all(isinstance(t, Token) for t in tokens)
+        assert [t.type for t in tokens[1:3]] == [TokenType.IDENT, TokenType.ASSIGN]
+        assert tokens[-1].type == TokenType.EOF
+    
+    def test_identifier_names_interned(self) -> None:
+        """Repeated identifiers share a single string object."""
+        tokens = tokenize("total = total + other_total")
+        
+        assert tokens[0].value is tokens[2].value
+        assert tokens[4].value == "other_total"
@@ -376,6 +376,28 @@ class TestPrecedence:
         value = program.statements[0].value
         assert isinstance(value, BinaryOp)
         assert value.operator == "=="
+    
+    def test_binary_operators_left_associative(self) -> None:
+        """Operators of equal precedence group to the left."""
+        source = "let x = 8 - 4 - 2"
+        tokens = tokenize(source)
+        program = parse(tokens)
+        
+        # Should parse as (8 - 4) - 2
+        value = program.statements[0].value
+        assert isinstance(value, BinaryOp)
+        assert isinstance(value.left, BinaryOp)
+        assert value.left.operator == "-"
+        assert isinstance(value.right, IntLiteral)
+    
+    def test_binary_operator_text_shared(self) -> None:
+        """Every BinaryOp for the same operator holds the same str object."""
+        program = parse(tokenize("let x = a <= b\nlet y = c <= d"))
+        
+        first = program.statements[0].value
+        second = program.statements[1].value
+        assert first.operator == "<="
+        assert first.operator is second.operator
 
 
 class TestErrors:
@@ -435,6 +457,15 @@ class TestParserClass:
         
         assert isinstance(program, Program)
         assert len(program.statements) == 1
+    
+    def test_nodes_have_no_instance_dict(self) -> None:
+        """AST nodes are slotted, base classes included."""
+        program = parse(tokenize("let x = 1 + y"))
+        stmt = program.statements[0]
+        
+        assert not hasattr(program, "__dict__")
+        assert not hasattr(stmt, "__dict__")
+        assert not hasattr(stmt.value, "__dict__")
 
 
 class TestTryExpression:
@@ -549,6 +580,17 @@ class TestParameterizedTypes:
         assert len(fn.return_type.params) == 1
         assert fn.return_type.params[0] == TypeAnnotation("Int")
     
+    def test_identical_annotations_are_separate_nodes(self) -> None:
+        """Each annotation site gets its own node, even when equal."""
+        tokens = tokenize("fn f(a: Option[Int], b: Option[Int], c: Int) -> Int { return c }")
+        program = parse(tokens)
+        
+        fn = program.functions[0]
+        a, b, c = (p.type_annotation for p in fn.params)
+        assert a == b and a is not b
+        assert a.params[0] == c and a.params[0] is not c
+        assert fn.return_type is not c
+    
     def test_result_type_annotation(self) -> None:
         """Parser handles Result[T, E] type."""
         tokens = tokenize("fn f() -> Result[Int, String] { return Ok(1) }")
@@ -162,6 +162,22 @@ class TestExpressionTranspilation:
         # The transpiler should preserve or escape the newline
         assert '"' in result
     
+    def test_string_escape_quotes_and_backslashes(self) -> None:
+        """Transpiler escapes quotes and backslashes in string literals."""
+        source = r'let x = "say \"hi\" \\ bye"'
+        result = compile_source(source)
+        assert 'x = "say \\"hi\\" \\\\ bye"' in result
+    
+    def test_string_escape_newlines_executable(self) -> None:
+        """Newlines and tabs in string literals are escaped, so the output compiles."""
+        source = r'let x = "line1\nline2\r\t"'
+        result = compile_source(source)
+        assert 'x = "line1\\nline2\\r\\t"' in result
+        
+        namespace: dict = {}
+        exec(result, namespace)
+        assert namespace["x"] == "line1\nline2\r\t"
+    
     def test_boolean_true(self) -> None:
         """Transpiler converts true to True."""
         result = compile_source("let x = true")
@@ -218,6 +234,19 @@ class TestExpressionTranspilation:
         source = 'let upper = msg.upper()'
         result = compile_no_check(source)
         assert "msg.upper()" in result
+    
+    def test_long_operator_chain(self) -> None:
+        """Operator chains deeper than the recursion limit still transpile."""
+        source = "let x = -" + " + ".join(["1"] * 3000)
+        result = compile_no_check(source)
+        assert result.count("(") == 3000
+        assert "((((-1) + 1) + 1)" in result
+    
+    def test_long_method_chain(self) -> None:
+        """Method-call chains deeper than the recursion limit still transpile."""
+        source = "let y = x" + ".f(1)" * 3000
+        result = compile_no_check(source)
+        assert result.endswith("y = x" + ".f(1)" * 3000)
 
 
 class TestIndentation:
@@ -501,6 +530,22 @@ fn add(a, b) {
         # Should NOT contain the runtime classes
         assert "class Ok:" not in result
         assert "class Err:" not in result
+    
+    def test_runtime_for_ok_inside_loop(self) -> None:
+        """Ok(...) nested in a loop body still pulls in the runtime."""
+        source = """
+fn wrap_all(xs) {
+    for x in xs {
+        print(Ok(x))
+    }
+}
+"""
+        result = compile_no_check(source)
+        
+        assert result.startswith("# Result type runtime")
+        namespace: dict = {}
+        exec(result, namespace)
+        namespace["wrap_all"]([1, 2])
 
 
 class TestMatchTranspilation:
@@ -588,6 +633,20 @@ fn unwrap_or_else(res: Result[Int, String], default: Int) -> Int {
         assert namespace["unwrap_or_else"](Ok(42), 0) == 42
         assert namespace["unwrap_or_else"](Err("error"), 99) == 99
     
+    def test_match_binding_only_renames_identifiers(self) -> None:
+        """Bindings are substituted for identifiers, not field names or text."""
+        source = """
+fn describe(opt: Option[Int]) -> String {
+    return match opt {
+        Some(v) => f(v, "v", p.v),
+        None => "none",
+    }
+}
+"""
+        result = compile_no_check(source)
+        
+        assert 'f(__match_0.value, "v", p.v)' in result
+    
     def test_match_as_expression(self) -> None:
         """match as expression in let statement."""
         source = """
@@ -26,7 +26,7 @@ from owllang.ast import (
     MatchExpr, MatchArm, SomePattern, NonePattern, OkPattern, ErrPattern,
 )
 from owllang.typechecker import (
-    TypeChecker, TypeError,
+    TypeChecker, TypeError, BUILTIN_FUNCTIONS,
     INT, FLOAT, STRING, BOOL, VOID, ANY,
     OptionType, ResultType,
 )
@@ -231,6 +231,57 @@ class TestVariables:
         assert len(checker.errors) == 1
         assert "undefined" in checker.errors[0].message.lower() and "variable" in checker.errors[0].message.lower()
     
+    def test_lookup_through_deep_scope_chain(self) -> None:
+        """Lookups walk arbitrarily deep scope chains without recursing."""
+        checker = TypeChecker()
+        checker.env.define_var("x", INT)
+        env = checker.env
+        for _ in range(5000):
+            env = env.child_scope()
+        assert env.lookup_var("x") == INT
+        assert env.lookup_fn("print") is not None
+        env.mark_var_used("x")
+        assert checker.env.var_info["x"].used
+        assert env.is_var_mutable("missing") is None
+    
+    def test_child_scope_definitions_do_not_leak(self) -> None:
+        """A child scope can shadow a name without affecting its parent."""
+        checker = TypeChecker()
+        parent = checker.env
+        parent.define_var("x", INT)
+        child = parent.child_scope()
+        child.define_var("x", STRING)
+        child.define_var("y", BOOL)
+        assert child.lookup_var("x") == STRING
+        assert parent.lookup_var("x") == INT
+        assert parent.lookup_var("y") is None
+        child.mark_var_used("x")
+        assert not parent.var_info["x"].used
+    
+    def test_checker_records_have_no_instance_dict(self) -> None:
+        """VarInfo, TypeError and builtin entries are slotted."""
+        checker = TypeChecker()
+        checker.env.define_var("x", INT)
+        assert not hasattr(checker.env.var_info["x"], "__dict__")
+        assert not hasattr(TypeError("msg", 1, 1), "__dict__")
+        assert not hasattr(BUILTIN_FUNCTIONS["len"], "__dict__")
+    
+    def test_builtin_registries_are_read_only(self) -> None:
+        """The builtin and constructor tables cannot be mutated."""
+        from types import MappingProxyType
+        from owllang.typechecker import TYPE_CONSTRUCTORS
+        assert isinstance(BUILTIN_FUNCTIONS, MappingProxyType)
+        assert isinstance(TYPE_CONSTRUCTORS, MappingProxyType)
+    
+    def test_checkers_share_builtins_not_definitions(self) -> None:
+        """Builtins are visible to every checker; user definitions stay local."""
+        first = TypeChecker()
+        first.env.define_fn("print", [INT], INT)
+        first.env.define_fn("helper", [], VOID)
+        second = TypeChecker()
+        assert second.env.lookup_fn("print") == ([ANY], VOID)
+        assert second.env.lookup_fn("helper") is None
+
     def test_let_statement(self) -> None:
         """Let statement should define variable with correct type."""
         checker = TypeChecker()
@@ -424,6 +475,20 @@ class TestProgramIntegration:
 class TestOptionType:
     """Test Option[T] type checking."""
     
+    def test_parameterized_types_compare_structurally(self) -> None:
+        """Separately built generic types are equal by structure."""
+        assert OptionType(INT) == OptionType(INT)
+        assert ResultType(OptionType(INT), STRING) == ResultType(OptionType(INT), STRING)
+        assert OptionType(INT) != OptionType(STRING)
+        # Equality treats Any as a wildcard
+        assert OptionType(INT) == OptionType(ANY)
+    
+    def test_parameterized_type_str_is_its_name(self) -> None:
+        """Generic types render as their precomputed name."""
+        typ = ResultType(OptionType(INT), STRING)
+        assert str(typ) == "Result[Option[Int], String]"
+        assert str(typ) is typ.name
+    
     def test_some_int_has_option_int_type(self) -> None:
         """Some(10) should have type Option[Int]."""
         checker = TypeChecker()
@@ -487,6 +552,14 @@ class TestOptionType:
 class TestResultType:
     """Test Result[T, E] type checking."""
     
+    def test_result_equality_treats_any_as_wildcard(self) -> None:
+        """Result types match per parameter, with Any matching anything."""
+        assert ResultType(INT, ANY) == ResultType(INT, STRING)
+        assert ResultType(ANY, STRING) == ResultType(INT, STRING)
+        assert ResultType(INT, STRING) != ResultType(FLOAT, STRING)
+        assert ResultType(INT, STRING) != ResultType(INT, BOOL)
+        assert ResultType(INT, STRING) != OptionType(INT)
+    
     def test_ok_int_has_result_type(self) -> None:
         """Ok(10) should have type Result[Int, Any]."""
         checker = TypeChecker()
@@ -606,6 +679,37 @@ class TestFunctionWithOptionResult:
 class TestIfAsExpression:
     """Test if/else as typed expression."""
     
+    def test_branch_let_visible_to_branch_value(self) -> None:
+        """Statements in a branch are checked before its trailing value."""
+        checker = TypeChecker()
+        # if true { let y = 1; y } else { 0 }
+        stmt = IfStmt(
+            condition=BoolLiteral(True),
+            then_body=[LetStmt("y", IntLiteral(1)), ExprStmt(Identifier("y"))],
+            else_body=[ExprStmt(IntLiteral(0))]
+        )
+        typ = checker._check_if_expr(stmt)
+        assert typ == INT
+        assert len(checker.errors) == 0
+    
+    def test_long_else_if_ladder(self) -> None:
+        """Else-if ladders deeper than the recursion limit are checked."""
+        checker = TypeChecker()
+        # if c { 0 } else { if c { 1 } else { ... else { "last" } } }
+        stmt: IfStmt | None = None
+        else_body = [ExprStmt(StringLiteral("last"))]
+        for i in range(5000):
+            stmt = IfStmt(
+                condition=BoolLiteral(True),
+                then_body=[ExprStmt(IntLiteral(i))],
+                else_body=else_body
+            )
+            else_body = [stmt]
+        typ = checker._check_if_expr(stmt)
+        assert typ == INT
+        # Only the innermost if mixes Int and String
+        assert len(checker.errors) == 1
+    
     def test_if_else_same_type_valid(self) -> None:
         """If branches with same type should be valid."""
         checker = TypeChecker()